@@ -1,5 +1,10 @@
 
-import math
+import os
+import sys
+
+# BasicStats shares the statistics kernel of PrivateLib/LiteData.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "PrivateLib"))
+from LiteData import Stats
 
 
 class TextAnalyzer:
@@ -138,64 +143,60 @@ class TextAnalyzer:
 
 
 class BasicStats:
+    """
+    Thin facade over LiteData.Stats: every metric comes from the same vectorized,
+    single-pass statistics kernel, so both entry points have the same performance.
+    """
     def __init__(self, data):
         """
         Initialize with a list of numerical data.
         Automatically sorts and stores essential info.
         """
-        self.data = sorted(data)
-        self.n = len(data)
+        self._stats = Stats(data)
+        self._data = self._stats.get_DataArray()
+        self.data = self._data.tolist()
+        self.n = self._stats.get_DataLength()
 
     def _mean(self):
         """Return the mean (average) value."""
-        return sum(self.data) / self.n if self.n else None
+        return self._stats.get_mean()
 
     def GetMean(self):
         return self._mean()
 
     def _median(self):
         """Return the median (middle) value."""
-        if self.n == 0:
-            return None
-        mid = self.n // 2
-        return self.data[mid] if self.n % 2 else (self.data[mid - 1] + self.data[mid]) / 2
+        return self._stats.get_median()
 
     def GetMedian(self):
         return self._median()
 
     def _mode(self):
         """Return a list of mode(s) — most frequent value(s)."""
-        if self.n == 0:
-            return []
-        freq = {}
-        for val in self.data:
-            freq[val] = freq.get(val, 0) + 1
-        max_count = max(freq.values())
-        return [val for val, count in freq.items() if count == max_count]
+        return self._stats.get_mode()
+
+    def GetMode(self):
+        return self._mode()
 
     def variance(self):
         """Return the variance of the dataset."""
-        if self.n == 0:
-            return None
-        mean_val = self.mean()
-        return sum((x - mean_val) ** 2 for x in self.data) / self.n
+        return self._stats.get_variance()
 
     def std_dev(self):
         """Return the standard deviation."""
-        var = self.variance()
-        return math.sqrt(var) if var is not None else None
+        return self._stats.get_std_dev()
 
     def minimum(self):
         """Return the minimum value."""
-        return min(self.data) if self.n else None
+        return self._stats.get_minimum()
 
     def maximum(self):
         """Return the maximum value."""
-        return max(self.data) if self.n else None
+        return self._stats.get_maximum()
 
     def range_val(self):
         """Return the range (max - min)."""
-        return self.maximum() - self.minimum() if self.n else None
+        return self._stats.get_range()
 
     def summary(self):
         """Print a formatted summary of all statistics."""
@@ -205,9 +206,9 @@ class BasicStats:
         print(f"Min        : {self.minimum()}")
         print(f"Max        : {self.maximum()}")
         print(f"Range      : {self.range_val()}")
-        print(f"Mean       : {self.mean():.2f}")
-        print(f"Median     : {self.median()}")
-        print(f"Mode       : {self.mode()}")
+        print(f"Mean       : {self.GetMean():.2f}")
+        print(f"Median     : {self.GetMedian()}")
+        print(f"Mode       : {self.GetMode()}")
         print(f"Variance   : {self.variance():.2f}")
         print(f"Std. Dev   : {self.std_dev():.2f}")
         print("-" * 40)
@@ -0,0 +1,191 @@
+## Benchmarks
+# Small timing scripts for the statistics and data-cleaning classes of PrivateLib.
+# Run from the Applications folder:
+#    python Benchmarks.py
+# Each benchmark prints its timings; none of them asserts on speed.
+
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "PrivateLib"))
+
+from Analizer import BasicStats
+from LiteData import Data, DataVisualization, HistogramAccumulator, Stats, TextAnalyzer
+from RollingStats import RollingStats
+
+
+def timed(func, repeat=3):
+    """
+    Return the best wall-clock time of `repeat` calls to func().
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# Benchmark: BasicStats vs Stats
+# Both entry points run on the same kernel, so their timings should match.
+def bench_basic_stats_parity(sizes=(10_000, 100_000, 1_000_000)):
+    rng = np.random.default_rng(0)
+    print("\nBasicStats vs Stats (construct + mean/median/mode/variance/std/min/max/range)")
+    print(f"{'n':>10}{'BasicStats':>14}{'Stats':>14}{'ratio':>8}")
+    for n in sizes:
+        data = rng.integers(0, 1000, n)
+
+        def run_basic():
+            b = BasicStats(data)
+            return (b.GetMean(), b.GetMedian(), b.GetMode(), b.variance(), b.std_dev(),
+                    b.minimum(), b.maximum(), b.range_val())
+
+        def run_stats():
+            s = Stats(data)
+            return (s.get_mean(), s.get_median(), s.get_mode(), s.get_variance(), s.get_std_dev(),
+                    s.get_minimum(), s.get_maximum(), s.get_range())
+
+        assert run_basic() == run_stats()
+        t_basic, t_stats = timed(run_basic), timed(run_stats)
+        print(f"{n:>10}{t_basic:>13.4f}s{t_stats:>13.4f}s{t_basic / t_stats:>8.2f}")
+
+
+# Benchmark: TextAnalyzer.analyze_many thread scaling
+# One shared Vocabulary per run; the ASCII fast path spends most of its time in NumPy.
+def bench_analyze_many_threads(n_texts=2_000, words_per_text=2_000, workers=(1, 2, 4, 8)):
+    rng = random.Random(0)
+    lexicon = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(1, 12)))
+               for _ in range(20_000)]
+    texts = [" ".join(rng.choice(lexicon) + rng.choice(("", "", "", ",", ".", "!", "?"))
+                      for _ in range(words_per_text)) for _ in range(n_texts)]
+    print(f"\nTextAnalyzer.analyze_many ({n_texts} texts x {words_per_text} words)")
+    print(f"{'workers':>10}{'time':>14}{'texts/s':>12}{'speedup':>9}")
+    base = None
+    for count in workers:
+        def run():
+            with ThreadPoolExecutor(max_workers=count) as pool:
+                return TextAnalyzer.analyze_many(texts, executor=pool)
+
+        elapsed = timed(run, repeat=1)
+        base = elapsed if base is None else base
+        print(f"{count:>10}{elapsed:>13.4f}s{n_texts / elapsed:>12.0f}{base / elapsed:>9.2f}")
+
+
+# Benchmark: Data on a Python list vs the vectorized array backend
+# Same values, same results; the array path sorts once instead of building a `seen` set.
+def bench_data_backends(sizes=(100_000, 1_000_000, 10_000_000)):
+    rng = np.random.default_rng(0)
+    methods = ("DuplicateCheck", "ReturnDuplicates", "NullCheck", "RmNull", "CleanData")
+    print("\nData: list vs ndarray backend (float column, 1% NaN, NaN -> None in the list)")
+    print(f"{'n':>10}{'method':>18}{'list':>12}{'array':>12}{'speedup':>9}")
+    for n in sizes:
+        values = rng.integers(0, n, n).astype(float)
+        values[rng.random(n) < 0.01] = np.nan
+        as_list = [None if v != v else v for v in values.tolist()]
+        for name in methods:
+            slow, fast = getattr(Data(as_list), name), getattr(Data(values), name)
+            assert slow() == fast()
+            t_list, t_array = timed(slow, repeat=1), timed(fast, repeat=1)
+            print(f"{n:>10}{name:>18}{t_list:>11.4f}s{t_array:>11.4f}s{t_list / t_array:>9.1f}")
+
+
+# Benchmark: RollingStats.batch vs a two-pass np.var over every window
+# Large-offset data (a long ramp and a random walk around 1e9) checks the precision of the O(n)
+# block sums; the two-pass reference costs O(n·w) time and memory.
+def bench_rolling_batch(n=200_000, windows=(5, 50, 500)):
+    rng = np.random.default_rng(0)
+    series = {"ramp": 1e9 + np.arange(float(n)), "walk": 1e9 + np.cumsum(rng.normal(size=n))}
+    print(f"\nRollingStats.batch on {n} values vs two-pass np.var")
+    print(f"{'data':>10}{'window':>8}{'batch':>12}{'two-pass':>12}{'speedup':>9}")
+    for name, values in series.items():
+        for window in windows:
+            windows_view = np.lib.stride_tricks.sliding_window_view(values, window)
+            expected = np.var(windows_view, axis=1)
+            assert np.allclose(RollingStats.batch(values, window)["variance"], expected, rtol=1e-9, atol=1e-9)
+            t_batch = timed(lambda: RollingStats.batch(values, window), repeat=1)
+            t_exact = timed(lambda: np.var(windows_view, axis=1), repeat=1)
+            print(f"{name:>10}{window:>8}{t_batch:>11.4f}s{t_exact:>11.4f}s{t_exact / t_batch:>9.1f}")
+
+
+# Benchmark: hash-partitioned parallel ReturnDuplicates
+# workers = 1 is the single-process sort; the others split the work over processes and
+# shared memory, so the speedup is bounded by the number of cores (run it on a multi-core machine).
+# The list column includes the conversion of the Python list to an array, which is serial.
+def bench_parallel_duplicates(n=20_000_000, workers=(1, 2, 4, 8)):
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, n, n)
+    items = values.tolist()
+    print(f"\nData.ReturnDuplicates on {n} int64 values ({os.cpu_count()} cores)")
+    print(f"{'workers':>10}{'array':>14}{'speedup':>9}{'list':>14}{'speedup':>9}")
+    expected = Data(values).ReturnDuplicates()
+    base = list_base = None
+    for count in workers:
+        assert Data(values).ReturnDuplicates(workers=count) == expected
+        elapsed = timed(lambda: Data(values).ReturnDuplicates(workers=count), repeat=1)
+        list_elapsed = timed(lambda: Data(items).ReturnDuplicates(workers=count), repeat=1)
+        base = elapsed if base is None else base
+        list_base = list_elapsed if list_base is None else list_base
+        print(f"{count:>10}{elapsed:>13.4f}s{base / elapsed:>9.2f}{list_elapsed:>13.4f}s{list_base / list_elapsed:>9.2f}")
+
+
+# Benchmark: DataVisualization render time vs point count
+# "none" plots every point and is only run up to `full_limit` points.
+def bench_visualization_render(sizes=(100_000, 1_000_000, 10_000_000, 50_000_000), full_limit=1_000_000):
+    rng = np.random.default_rng(0)
+    print("\nDataVisualization.line_plot to PNG (1200 x 600 px)")
+    print(f"{'points':>12}{'method':>10}{'drawn':>10}{'time':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        DataVisualization(np.arange(10.0)).line_plot(os.path.join(tmp, "warmup.png"))
+        for n in sizes:
+            series = np.cumsum(rng.normal(size=n))
+            for method in ("none", "minmax", "lttb"):
+                if method == "none" and n > full_limit:
+                    continue
+                path = os.path.join(tmp, f"{method}_{n}.png")
+                plots = []
+
+                def run():
+                    plots.append(DataVisualization(series, method=method))
+                    plots[-1].line_plot(path)
+
+                elapsed = timed(run, repeat=1)
+                print(f"{n:>12}{method:>10}{len(plots[-1].get_points()[0]):>10}{elapsed:>11.3f}s")
+
+
+# Benchmark: distribution charts from one-pass summaries
+# Each column is summarised once (HistogramAccumulator); the charts are then drawn from the bins,
+# one figure per chart vs one reused figure template for the whole batch.
+def bench_summary_charts(n_charts=40, n=1_000_000):
+    rng = np.random.default_rng(0)
+    summaries = []
+    start = time.perf_counter()
+    for i in range(n_charts):
+        histogram = HistogramAccumulator()
+        histogram.update(rng.normal(i, 1 + i / 10, n))
+        summaries.append(histogram)
+    print(f"\nSummary charts: {n_charts} columns x {n} values (summarised in {time.perf_counter() - start:.3f}s)")
+    print(f"{'chart':>10}{'one by one':>14}{'batch':>12}{'speedup':>9}")
+    single = {"histogram": DataVisualization.histogram, "box": DataVisualization.box_plot,
+              "ecdf": DataVisualization.ecdf}
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind, render in single.items():
+            paths = [os.path.join(tmp, f"{kind}_{i}.png") for i in range(n_charts)]
+            t_single = timed(lambda: [render(h, p) for h, p in zip(summaries, paths)], repeat=1)
+            t_batch = timed(lambda: DataVisualization.render_many(kind, summaries, paths), repeat=1)
+            print(f"{kind:>10}{t_single:>13.3f}s{t_batch:>11.3f}s{t_single / t_batch:>9.2f}")
+
+
+if __name__ == "__main__":
+    bench_basic_stats_parity()
+    bench_analyze_many_threads()
+    bench_data_backends()
+    bench_rolling_batch()
+    bench_parallel_duplicates()
+    bench_visualization_render()
+    bench_summary_charts()
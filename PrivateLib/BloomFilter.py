@@ -0,0 +1,123 @@
+## BloomFilter Class
+# Fixed-memory membership sketch for duplicate detection on streams too large for a Python set.
+# The bit array (m bits) and the number of hash functions (k) are sized from the expected number
+# of items n and the target false-positive rate p:  m = -n ln p / (ln 2)²,  k = (m / n) ln 2.
+# Items are hashed a batch at a time: NumPy arrays with hash_array, Python objects with hash_objects
+# (the two agree on numbers and strings, so lists and arrays can feed the same filter). Hashes are
+# expanded to k bit positions by double hashing (h1 + i·h2 mod m).
+# There are no false negatives; a "seen before" answer is wrong with probability ≈ p once n items
+# have been added.
+# Example usage:
+# b = BloomFilter(capacity=1_000_000, error_rate=0.001)
+# print(b.add_many([1, 2, 3, 2]))   # Output: [False False False  True]
+# print(3 in b, 4 in b)             # Output: True False
+
+import math
+from itertools import islice
+
+import numpy as np
+
+from Hashing import _mix64, hash_array, hash_objects
+
+
+class BloomFilter:
+    # Items hashed per batch when reading iterables.
+    BATCH = 65_536
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Initialize an empty filter sized for `capacity` items at the given false-positive rate.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1.")
+        if not 0 < error_rate < 1:
+            raise ValueError("Error rate must be between 0 and 1.")
+        self.__Capacity = capacity
+        self.__ErrorRate = error_rate
+        self.__BitCount = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.__HashCount = max(1, round(self.__BitCount / capacity * math.log(2)))
+        self.__Bits = np.zeros((self.__BitCount + 7) // 8, dtype=np.uint8)
+        self.__Count = 0
+
+    # ---------- Private Methods ---------- #
+
+    @staticmethod
+    def __keys(items):
+        """
+        64-bit keys of a batch: hash_array for arrays, hash_objects for Python objects.
+        """
+        if isinstance(items, np.ndarray) and items.dtype.kind != "O":
+            return hash_array(items)
+        return hash_objects(items)
+
+    def __positions(self, keys):
+        """
+        k bit positions per key (one row per key).
+        """
+        h1 = _mix64(keys)
+        h2 = _mix64(keys ^ np.uint64(0x9E3779B97F4A7C15)) | np.uint64(1)
+        steps = np.arange(self.__HashCount, dtype=np.uint64)
+        return (h1[:, None] + steps * h2[:, None]) % np.uint64(self.__BitCount)
+
+    def __test(self, positions):
+        """
+        True for the rows whose k bits are all set.
+        """
+        return ((self.__Bits[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1).all(axis=1)
+
+    # ---------- Public Methods ---------- #
+
+    def add_many(self, items) -> np.ndarray:
+        """
+        Add a batch of items; return for each one whether it was (probably) seen before,
+        counting repeats inside the batch.
+        """
+        if not isinstance(items, (np.ndarray, list, tuple)):
+            items = list(items)
+        if not len(items):
+            return np.zeros(0, dtype=bool)
+        keys = self.__keys(items)
+        positions = self.__positions(keys)
+        seen = self.__test(positions)
+        _, first = np.unique(keys, return_index=True)
+        repeat = np.ones(len(keys), dtype=bool)
+        repeat[first] = False
+        bits = np.left_shift(1, (positions & np.uint64(7)).astype(np.uint8)).astype(np.uint8)
+        np.bitwise_or.at(self.__Bits, positions >> np.uint64(3), bits)
+        self.__Count += len(keys)
+        return seen | repeat
+
+    def add(self, item) -> bool:
+        """
+        Add one item; return whether it was (probably) seen before.
+        """
+        return bool(self.add_many([item])[0])
+
+    def update(self, iterable):
+        """
+        Add every item of an iterable or generator, BATCH items at a time.
+        """
+        iterator = iter(iterable)
+        while batch := list(islice(iterator, self.BATCH)):
+            self.add_many(batch)
+
+    def __contains__(self, item):
+        return bool(self.__test(self.__positions(self.__keys([item])))[0])
+
+    def __len__(self):
+        return self.__Count
+
+    # ---------- Public Getters ---------- #
+
+    def get_capacity(self): return self.__Capacity
+    def get_error_rate(self): return self.__ErrorRate
+    def get_bit_count(self): return self.__BitCount
+    def get_hash_count(self): return self.__HashCount
+    def get_memory(self): return self.__Bits.nbytes
+    def get_fill_ratio(self): return float(np.unpackbits(self.__Bits).sum()) / (8 * len(self.__Bits))
+
+    def get_false_positive_rate(self):
+        """
+        Current false-positive probability, (fraction of set bits) ** k.
+        """
+        return self.get_fill_ratio() ** self.__HashCount
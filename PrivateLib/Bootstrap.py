@@ -0,0 +1,188 @@
+## Bootstrap Class
+# This class computes bootstrap confidence intervals for a Stats metric (mean, median, std. dev, variance).
+# Instead of building thousands of Stats objects on resampled lists, resample indices are generated
+# in vectorized blocks (one 2-D index matrix per block) and the statistic is evaluated for every
+# resample of the block with a single array operation along axis 1.
+# Blocks can be spread across a process pool. Every block gets its own child seed spawned from one
+# np.random.SeedSequence, so the result is reproducible and does not depend on the number of workers.
+# It provides:
+#    • The bootstrap distribution and standard error
+#    • Percentile interval
+#    • BCa interval (bias-corrected and accelerated, acceleration from the jackknife)
+# Example usage:
+# b = Bootstrap(Stats([2, 4, 4, 5, 7, 9, 10, 12]), statistic="mean", seed=42)
+# print(b.get_percentile_interval(0.95))
+# print(b.get_bca_interval(0.95))
+# b.summary()
+
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+
+from LiteData import Stats
+
+# Target number of resampled values held in memory per block (resamples x sample size).
+BLOCK_ELEMENTS = 4_000_000
+
+_STATISTICS = {
+    "mean": lambda x: x.mean(axis=1),
+    "median": lambda x: np.median(x, axis=1),
+    "std_dev": lambda x: x.std(axis=1),
+    "variance": lambda x: x.var(axis=1),
+}
+
+_ESTIMATES = {
+    "mean": Stats.get_mean,
+    "median": Stats.get_median,
+    "std_dev": Stats.get_std_dev,
+    "variance": Stats.get_variance,
+}
+
+_worker_data = None
+
+
+def _init_worker(data):
+    """
+    Process-pool initializer: receive the sample once per worker instead of once per block.
+    """
+    global _worker_data
+    _worker_data = data
+
+
+def _resample_block(statistic, size, seed, data=None):
+    """
+    Evaluate the statistic on `size` resamples drawn with the given SeedSequence.
+    """
+    data = _worker_data if data is None else data
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, len(data), size=(size, len(data)))
+    return _STATISTICS[statistic](data[idx])
+
+
+class Bootstrap:
+    def __init__(self, data, statistic: str = "mean", n_resamples: int = 9999,
+                 seed=None, workers: int = 1, block_size: int | None = None):
+        """
+        Initialize with a Stats object (or raw numeric data) and run the resampling.
+        `workers` > 1 spreads the blocks across a process pool.
+        """
+        if statistic not in _STATISTICS:
+            raise ValueError(f"Statistic must be one of {list(_STATISTICS)}.")
+        if n_resamples < 1:
+            raise ValueError("Number of resamples must be at least 1.")
+        self.__Stats = data if isinstance(data, Stats) else Stats(data)
+        if self.__Stats.is_streamed():
+            raise ValueError("Bootstrap needs the data in memory; streamed Stats cannot be resampled.")
+        if self.__Stats.get_weights() is not None:
+            raise ValueError("Bootstrap resamples raw observations; weighted Stats are not supported.")
+        if not self.__Stats.get_DataLength():
+            raise ValueError("Cannot bootstrap an empty dataset.")
+
+        self.__Data = np.asarray(self.__Stats.get_DataArray(), dtype=float)
+        self.__Statistic = statistic
+        self.__Estimate = _ESTIMATES[statistic](self.__Stats)
+        if block_size is None:
+            block_size = max(1, BLOCK_ELEMENTS // len(self.__Data))
+        self.__Distribution = self.__resample(n_resamples, block_size, seed, workers)
+
+    # ---------- Private Methods ---------- #
+
+    def __resample(self, n_resamples, block_size, seed, workers):
+        """
+        Draw all resamples block by block; each block has an independent child seed.
+        """
+        sizes = [min(block_size, n_resamples - start) for start in range(0, n_resamples, block_size)]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        stats = [self.__Statistic] * len(sizes)
+        if workers > 1 and len(sizes) > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(self.__Data,)) as pool:
+                blocks = list(pool.map(_resample_block, stats, sizes, seeds))
+        else:
+            blocks = [_resample_block(st, size, sd, self.__Data) for st, size, sd in zip(stats, sizes, seeds)]
+        return np.concatenate(blocks)
+
+    def __jackknife(self):
+        """
+        Leave-one-out values of the statistic, in closed vectorized form (no n x n matrix).
+        """
+        x = self.__Data
+        n = len(x)
+        if self.__Statistic == "median":
+            x = np.sort(x)
+            i = np.arange(n)
+            m = n - 1
+
+            def remaining(j):
+                # j-th smallest value once the i-th smallest has been removed
+                return np.where(j < i, x[j], x[min(j + 1, n - 1)])
+
+            if m % 2:
+                return remaining(m // 2)
+            return (remaining(m // 2 - 1) + remaining(m // 2)) / 2
+
+        centered = x - x.mean()
+        s1, s2 = centered.sum(), (centered * centered).sum()
+        loo_mean = (s1 - centered) / (n - 1)
+        if self.__Statistic == "mean":
+            return loo_mean + x.mean()
+        loo_var = np.maximum((s2 - centered * centered) / (n - 1) - loo_mean * loo_mean, 0.0)
+        return loo_var if self.__Statistic == "variance" else np.sqrt(loo_var)
+
+    # ---------- Public Getters ---------- #
+
+    def get_statistic(self): return self.__Statistic
+    def get_estimate(self): return self.__Estimate
+    def get_distribution(self): return self.__Distribution
+    def get_std_error(self): return float(self.__Distribution.std(ddof=1)) if len(self.__Distribution) > 1 else 0.0
+
+    def get_percentile_interval(self, confidence: float = 0.95) -> tuple:
+        """
+        Percentile interval: the (α/2, 1 - α/2) quantiles of the bootstrap distribution.
+        """
+        alpha = 1 - confidence
+        low, high = np.quantile(self.__Distribution, [alpha / 2, 1 - alpha / 2])
+        return float(low), float(high)
+
+    def get_bca_interval(self, confidence: float = 0.95) -> tuple:
+        """
+        BCa interval: percentile interval with quantile levels shifted by the bias correction z0
+        and the jackknife acceleration a.
+        """
+        normal = NormalDist()
+        alpha = 1 - confidence
+        below = np.mean(self.__Distribution < self.__Estimate)
+        below = min(max(below, 1 / (len(self.__Distribution) + 1)), 1 - 1 / (len(self.__Distribution) + 1))
+        z0 = normal.inv_cdf(below)
+
+        if len(self.__Data) > 2:
+            jack = self.__jackknife()
+            diff = jack.mean() - jack
+            denom = 6 * (diff * diff).sum() ** 1.5
+            accel = float((diff ** 3).sum() / denom) if denom else 0.0
+        else:
+            accel = 0.0
+
+        levels = []
+        for z_alpha in (normal.inv_cdf(alpha / 2), normal.inv_cdf(1 - alpha / 2)):
+            shifted = z0 + (z0 + z_alpha) / (1 - accel * (z0 + z_alpha))
+            levels.append(normal.cdf(shifted))
+        low, high = np.quantile(self.__Distribution, levels)
+        return float(low), float(high)
+
+    def summary(self, confidence: float = 0.95):
+        """
+        Print a clean and formatted summary of the bootstrap results.
+        """
+        low_p, high_p = self.get_percentile_interval(confidence)
+        low_b, high_b = self.get_bca_interval(confidence)
+        print("\n📊 Bootstrap Summary:")
+        print("-" * 40)
+        print(f"Statistic  : {self.__Statistic}")
+        print(f"Estimate   : {self.__Estimate:.4f}")
+        print(f"Resamples  : {len(self.__Distribution)}")
+        print(f"Std. Error : {self.get_std_error():.4f}")
+        print(f"Percentile : [{low_p:.4f}, {high_p:.4f}] ({confidence:.0%})")
+        print(f"BCa        : [{low_b:.4f}, {high_b:.4f}] ({confidence:.0%})")
+        print("-" * 40)
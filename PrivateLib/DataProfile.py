@@ -0,0 +1,160 @@
+## DataProfile Class
+# Single-pass, mergeable profile of a column: size, null count, approximate distinct count
+# (HyperLogLog), duplicate ratio and top values. Each chunk is read once: the null mask, the sketch
+# update and the chunk's value counts come from the same pass, so no full set is ever built.
+# Top values use a Misra-Gries summary of `capacity` counters: counts are lower bounds, too low by at
+# most get_count_error() (which is ≤ non-null values / (capacity + 1)), and any value more frequent than
+# that bound is guaranteed to be kept. Profiles of separate chunks (or files) merge with merge().
+# Nulls are None in Python collections and NaN / NaT in arrays, as in Data.
+# Example usage:
+# p = DataProfile()
+# for chunk in chunks: p.update(chunk)
+# p.summary()
+
+import numpy as np
+
+from HyperLogLog import HyperLogLog
+from NullMask import _null_mask
+
+
+class DataProfile:
+    def __init__(self, precision: int = 14, capacity: int = 1024):
+        """
+        Initialize an empty profile (HyperLogLog precision, number of top-value counters).
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1.")
+        self.__Size = 0
+        self.__Nulls = 0
+        self.__Sketch = HyperLogLog(precision)
+        self.__Capacity = capacity
+        self.__Counts = {}
+        self.__CountError = 0
+
+    # ---------- Private Methods ---------- #
+
+    def __trim(self, values, counts):
+        """
+        Misra-Gries step: keep the `capacity` largest counts, minus the next largest count.
+        """
+        if len(counts) <= self.__Capacity:
+            return values, counts, 0
+        cut = int(np.partition(counts, len(counts) - self.__Capacity - 1)[len(counts) - self.__Capacity - 1])
+        keep = counts > cut
+        return values[keep], counts[keep] - cut, cut
+
+    def __add_counts(self, values, counts):
+        """
+        Fold a chunk's exact value counts into the summary.
+        """
+        values, counts, cut = self.__trim(values, counts)
+        self.__CountError += cut
+        table = self.__Counts
+        for value, count in zip(values.tolist(), counts.tolist()):
+            table[value] = table.get(value, 0) + count
+        if len(table) > self.__Capacity:
+            keys = list(table)
+            kept, kept_counts, cut = self.__trim(np.arange(len(keys)),
+                                                 np.fromiter(table.values(), dtype=np.int64, count=len(keys)))
+            self.__Counts = {keys[i]: c for i, c in zip(kept.tolist(), kept_counts.tolist())}
+            self.__CountError += cut
+
+    # ---------- Public Methods ---------- #
+
+    def update(self, chunk):
+        """
+        Profile one more chunk (NumPy array, pandas Series or iterable of hashable values).
+        """
+        if hasattr(chunk, "isnull") and hasattr(chunk, "to_numpy"):
+            chunk = chunk.to_numpy()
+        if isinstance(chunk, np.ndarray) and chunk.ndim == 1 and chunk.dtype.kind != "O":
+            nulls = _null_mask(chunk)
+            present = chunk[~nulls]
+            self.__Size += len(chunk)
+            self.__Nulls += int(np.count_nonzero(nulls))
+            self.__Sketch.update(present)
+            values, counts = np.unique(present, return_counts=True)
+        else:
+            table = {}
+            size = 0
+            for item in chunk:
+                size += 1
+                table[item] = table.get(item, 0) + 1
+            self.__Size += size
+            self.__Nulls += table.pop(None, 0)
+            self.__Sketch.update(list(table))
+            values = np.empty(len(table), dtype=object)
+            values[:] = list(table)
+            counts = np.fromiter(table.values(), dtype=np.int64, count=len(table))
+        self.__add_counts(values, counts)
+        return self
+
+    def merge(self, other):
+        """
+        Merge the profile of another chunk into this one.
+        """
+        self.__Size += other.get_size()
+        self.__Nulls += other.get_null_count()
+        self.__Sketch.merge(other.get_sketch())
+        self.__CountError += other.get_count_error()
+        top = other.get_top_values(None)
+        values = np.empty(len(top), dtype=object)
+        values[:] = [value for value, _ in top]
+        self.__add_counts(values, np.array([count for _, count in top], dtype=np.int64))
+        return self
+
+    # ---------- Public Getters ---------- #
+
+    def get_size(self): return self.__Size
+    def get_null_count(self): return self.__Nulls
+    def get_sketch(self): return self.__Sketch
+    def get_count_error(self): return self.__CountError
+
+    def get_distinct_count(self):
+        """
+        Approximate number of distinct non-null values (never more than the non-null count).
+        """
+        return min(self.__Sketch.get_count(), self.__Size - self.__Nulls)
+
+    def get_duplicate_ratio(self):
+        """
+        Share of non-null values that repeat an earlier value: 1 - distinct / non-null.
+        """
+        present = self.__Size - self.__Nulls
+        return 1 - self.get_distinct_count() / present if present else 0.0
+
+    def get_top_values(self, k: int | None = 10):
+        """
+        Most frequent values as (value, count) pairs, largest count first.
+        """
+        top = sorted(self.__Counts.items(), key=lambda item: -item[1])
+        return top if k is None else top[:k]
+
+    def get_report(self):
+        """
+        All profile figures as a dict.
+        """
+        return {
+            "size": self.__Size,
+            "nulls": self.__Nulls,
+            "distinct": self.get_distinct_count(),
+            "duplicate_ratio": self.get_duplicate_ratio(),
+            "top_values": self.get_top_values(),
+            "distinct_error": self.__Sketch.get_error(),
+            "count_error": self.__CountError,
+        }
+
+    def summary(self, k: int = 5):
+        """
+        Print a clean and formatted summary of the profile.
+        """
+        print("\n📊 Data Profile:")
+        print("-" * 40)
+        print(f"Size            : {self.__Size}")
+        print(f"Null values     : {self.__Nulls}")
+        print(f"Distinct (≈)    : {self.get_distinct_count()} (±{self.__Sketch.get_error():.1%})")
+        print(f"Duplicate ratio : {self.get_duplicate_ratio():.2%}")
+        print("Top values      :")
+        for value, count in self.get_top_values(k):
+            print(f"    {str(value):<20}{count:>12}")
+        print("-" * 40)
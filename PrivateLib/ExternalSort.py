@@ -0,0 +1,165 @@
+## ExternalSort Class
+# Out-of-core version of Data.CleanData for files of values that do not fit in memory.
+# The input is a text file (one value per line) or a 1-D .npy file (read memory-mapped).
+# 1. Runs: the file is read `chunksize` values at a time; null values are dropped and every chunk
+#    is reduced to its sorted distinct values with their counts (np.unique), then spilled to a
+#    temporary .npy pair in the working directory (or `tmp_dir`).
+# 2. Merge: all runs are merged k ways in blocks. Every step reads the next `block` values of each
+#    run, takes the smallest of the block maxima as a cutoff and combines everything up to the cutoff
+#    with one vectorized unique + bincount, so at least one run block is finished per step and memory
+#    stays at about k x block values.
+# The sorted, null-free, deduplicated output is produced as a stream of arrays, and the duplicate
+# counts are collected along the way (get_report). Temporary files are removed when the stream ends.
+# Example usage:
+# e = ExternalSort("ids.txt", dtype=int, chunksize=5_000_000)
+# e.write("ids_clean.txt")
+# print(e.get_report())   # Output: {'values': ..., 'nulls': ..., 'distinct': ..., 'duplicates': ..., ...}
+
+import os
+import tempfile
+from itertools import islice
+
+import numpy as np
+
+# Text tokens treated as null values (the file equivalent of None).
+NULL_TOKENS = ("", "None", "null", "NULL", "nan", "NaN", "NA")
+
+
+class ExternalSort:
+    def __init__(self, path, dtype=float, chunksize: int = 1_000_000, block: int = 65_536,
+                 tmp_dir=None, null_values=NULL_TOKENS):
+        """
+        Initialize with the input file. `chunksize` bounds the values sorted in memory per run,
+        `block` the values read per run during the merge.
+        """
+        if chunksize < 1 or block < 1:
+            raise ValueError("Chunk size and block size must be at least 1.")
+        self.__Path = path
+        self.__DType = dtype
+        self.__ChunkSize = chunksize
+        self.__Block = block
+        self.__TmpDir = os.getcwd() if tmp_dir is None else tmp_dir
+        self.__NullValues = frozenset(null_values)
+        self.__Report = None
+
+    # ---------- Private Methods ---------- #
+
+    def __chunks(self):
+        """
+        Null-free chunks of the input, as NumPy arrays.
+        """
+        if str(self.__Path).endswith(".npy"):
+            source = np.load(self.__Path, mmap_mode="r")
+            if source.ndim != 1:
+                raise ValueError("The .npy file must hold a 1-D array.")
+            for start in range(0, len(source), self.__ChunkSize):
+                chunk = np.asarray(source[start:start + self.__ChunkSize])
+                if chunk.dtype.kind in "fc":
+                    nulls = np.isnan(chunk)
+                elif chunk.dtype.kind in "mM":
+                    nulls = np.isnat(chunk)
+                else:
+                    nulls = np.zeros(len(chunk), dtype=bool)
+                self.__Report["values"] += len(chunk)
+                self.__Report["nulls"] += int(nulls.sum())
+                yield chunk[~nulls]
+            return
+        with open(self.__Path, encoding="utf-8") as handle:
+            while lines := list(islice(handle, self.__ChunkSize)):
+                tokens = [line.strip() for line in lines]
+                values = [token for token in tokens if token not in self.__NullValues]
+                self.__Report["values"] += len(tokens)
+                self.__Report["nulls"] += len(tokens) - len(values)
+                yield np.array(values, dtype=self.__DType)
+
+    def __spill(self, tmp):
+        """
+        Sort and reduce every chunk to (distinct values, counts) and write it as a run.
+        """
+        runs = []
+        for chunk in self.__chunks():
+            if not len(chunk):
+                continue
+            values, counts = np.unique(chunk, return_counts=True)
+            stem = os.path.join(tmp, f"run{len(runs)}")
+            np.save(stem + "_values.npy", values)
+            np.save(stem + "_counts.npy", counts)
+            runs.append(stem)
+        return runs
+
+    def __merge(self, runs):
+        """
+        Block-wise k-way merge of the runs; yields (distinct values, total counts) in order.
+        """
+        sources = [(np.load(stem + "_values.npy", mmap_mode="r"), np.load(stem + "_counts.npy", mmap_mode="r"))
+                   for stem in runs]
+        positions = [0] * len(sources)
+        active = list(range(len(sources)))
+        while active:
+            blocks = [sources[r][0][positions[r]:positions[r] + self.__Block] for r in active]
+            cutoff = min(block[-1] for block in blocks)
+            values, counts = [], []
+            for r, block in zip(active, blocks):
+                take = int(np.searchsorted(block, cutoff, side="right"))
+                values.append(block[:take])
+                counts.append(sources[r][1][positions[r]:positions[r] + take])
+                positions[r] += take
+            active = [r for r in active if positions[r] < len(sources[r][0])]
+            unique, inverse = np.unique(np.concatenate(values), return_inverse=True)
+            yield unique, np.bincount(inverse, weights=np.concatenate(counts)).astype(np.int64)
+        del sources
+
+    # ---------- Public Methods ---------- #
+
+    def blocks(self, with_counts: bool = False):
+        """
+        Stream the sorted distinct non-null values as arrays (with their counts if requested).
+        The report is complete once the stream has been fully consumed.
+        """
+        self.__Report = {"values": 0, "nulls": 0, "distinct": 0, "duplicates": 0,
+                         "duplicated_values": 0, "runs": 0}
+        with tempfile.TemporaryDirectory(prefix="extsort_", dir=self.__TmpDir) as tmp:
+            runs = self.__spill(tmp)
+            self.__Report["runs"] = len(runs)
+            for unique, counts in self.__merge(runs):
+                self.__Report["distinct"] += len(unique)
+                self.__Report["duplicates"] += int((counts - 1).sum())
+                self.__Report["duplicated_values"] += int((counts > 1).sum())
+                yield (unique, counts) if with_counts else unique
+
+    def __iter__(self):
+        for block in self.blocks():
+            yield from block.tolist()
+
+    def write(self, out_path) -> dict:
+        """
+        Write the cleaned values to a text file, one per line, and return the report.
+        """
+        with open(out_path, "w", encoding="utf-8") as handle:
+            for block in self.blocks():
+                handle.write("".join(f"{value}\n" for value in block.tolist()))
+        return self.get_report()
+
+    # ---------- Public Getters ---------- #
+
+    def get_path(self): return self.__Path
+    def get_report(self): return dict(self.__Report) if self.__Report is not None else None
+
+    def summary(self):
+        """
+        Print a clean and formatted summary of the last run.
+        """
+        report = self.get_report()
+        if report is None:
+            print("No data processed yet.")
+            return
+        print("\n📊 External Sort Summary:")
+        print("-" * 40)
+        print(f"File              : {self.__Path}")
+        print(f"Values read       : {report['values']}")
+        print(f"Null values       : {report['nulls']}")
+        print(f"Distinct values   : {report['distinct']}")
+        print(f"Duplicates        : {report['duplicates']}")
+        print(f"Duplicated values : {report['duplicated_values']}")
+        print(f"Sorted runs       : {report['runs']}")
+        print("-" * 40)
@@ -0,0 +1,189 @@
+## GroupStats Class
+# This class computes per-group statistics ("per customer / per sensor") over keyed numeric data.
+# It takes a key array and a value array of the same length and computes, for every distinct key:
+#    • Count, Mean, Median
+#    • Variance & Standard Deviation (population, same as Stats)
+#    • Min, Max
+#    • Skewness & excess Kurtosis (same conventions as Stats)
+# Instead of building one Stats object per group in a Python loop, the data is sorted once by key
+# and every metric is computed for all groups at once with segment reductions (np.add.reduceat).
+# The result is a columnar table: one NumPy array per metric, aligned with get_keys().
+# Example usage:
+# g = GroupStats(["a", "b", "a", "b", "a"], [1, 10, 3, 20, 5])
+# print(g.get_keys())   # Output: ['a' 'b']
+# print(g.get_mean())   # Output: [ 3. 15.]
+# g.summary()
+
+import numpy as np
+
+
+class GroupStats:
+    def __init__(self, keys, values):
+        """
+        Initialize the grouped statistics with a key array and a value array.
+        Data is sorted by (key, value) once so every group is a contiguous, sorted segment.
+        """
+        keys = np.asarray(keys)
+        values = np.asarray(values, dtype=float)
+        if keys.ndim != 1 or values.ndim != 1:
+            raise ValueError("Keys and values must be 1-D arrays.")
+        if len(keys) != len(values):
+            raise ValueError("Keys and values must have the same length.")
+
+        order = np.lexsort((values, keys))
+        self.__Keys = keys[order]
+        self.__Values = values[order]
+        self.__DataLength = len(values)
+
+        if self.__DataLength:
+            boundary = np.flatnonzero(self.__Keys[1:] != self.__Keys[:-1]) + 1
+            self.__Starts = np.concatenate(([0], boundary))
+        else:
+            self.__Starts = np.empty(0, dtype=np.intp)
+        self.__Counts = np.diff(np.append(self.__Starts, self.__DataLength))
+        # Group index of every (sorted) element, used to broadcast per-group values back to rows.
+        self.__GroupIndex = np.repeat(np.arange(len(self.__Starts)), self.__Counts)
+
+    # ---------- Private Methods ---------- #
+
+    def __segment_sum(self, arr):
+        """
+        Sum `arr` over every group segment in one vectorized pass.
+        """
+        if not self.__DataLength:
+            return np.empty(0)
+        return np.add.reduceat(arr, self.__Starts)
+
+    def __mean(self):
+        """
+        Compute the arithmetic mean of every group.
+        """
+        return self.__segment_sum(self.__Values) / self.__Counts
+
+    def __central_moment(self, order, mean=None):
+        """
+        Compute the population central moment of the given order for every group.
+        """
+        mean = self.__mean() if mean is None else mean
+        dev = self.__Values - mean[self.__GroupIndex]
+        return self.__segment_sum(dev ** order) / self.__Counts
+
+    def __median(self):
+        """
+        Compute the median of every group.
+        Groups are already sorted by value, so the middle element(s) are picked by index.
+        """
+        lower = self.__Starts + (self.__Counts - 1) // 2
+        upper = self.__Starts + self.__Counts // 2
+        return (self.__Values[lower] + self.__Values[upper]) / 2
+
+    def __variance(self):
+        """
+        Calculate the population variance (σ²) of every group.
+        """
+        return self.__central_moment(2)
+
+    def __std_dev(self):
+        """
+        Calculate the standard deviation (σ) of every group.
+        """
+        return np.sqrt(self.__variance())
+
+    def __minimum(self):
+        """
+        Return the smallest value of every group (first element of each sorted segment).
+        """
+        return self.__Values[self.__Starts]
+
+    def __maximum(self):
+        """
+        Return the largest value of every group (last element of each sorted segment).
+        """
+        return self.__Values[self.__Starts + self.__Counts - 1]
+
+    def __standardized_moment(self, order, min_count):
+        """
+        Compute m_k / σ^k for every group.
+        Groups smaller than `min_count` get 0 (as in Stats), constant groups get NaN.
+        """
+        mean = self.__mean()
+        moment = self.__central_moment(order, mean)
+        sd = np.sqrt(self.__central_moment(2, mean))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = moment / sd ** order
+        return np.where(self.__Counts < min_count, 0.0, result)
+
+    def __skewness(self):
+        """
+        Calculate skewness of every group: measure of asymmetry.
+        """
+        return self.__standardized_moment(3, 3)
+
+    def __kurtosis(self):
+        """
+        Calculate excess kurtosis of every group: measure of tailedness.
+        """
+        return np.where(self.__Counts < 4, 0.0, self.__standardized_moment(4, 4) - 3)
+
+    # ---------- Public Getters ---------- #
+
+    def get_keys(self): return self.__Keys[self.__Starts]
+    def get_count(self): return self.__Counts
+    def get_DataLength(self): return self.__DataLength
+
+    def get_mean(self): return self.__mean()
+    def get_median(self): return self.__median()
+
+    def get_variance(self): return self.__variance()
+    def get_std_dev(self): return self.__std_dev()
+
+    def get_minimum(self): return self.__minimum()
+    def get_maximum(self): return self.__maximum()
+
+    def get_skewness(self): return self.__skewness()
+    def get_kurtosis(self): return self.__kurtosis()
+
+    def table(self) -> dict:
+        """
+        Return every metric as a columnar table: {column name: NumPy array}, one row per key.
+        The mean is computed once and shared by the moment-based columns.
+        """
+        mean = self.__mean()
+        m2 = self.__central_moment(2, mean)
+        sd = np.sqrt(m2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            skew = self.__central_moment(3, mean) / sd ** 3
+            kurt = self.__central_moment(4, mean) / sd ** 4 - 3
+        return {
+            "key": self.get_keys(),
+            "count": self.__Counts,
+            "mean": mean,
+            "variance": m2,
+            "std_dev": sd,
+            "min": self.__minimum(),
+            "max": self.__maximum(),
+            "median": self.__median(),
+            "skewness": np.where(self.__Counts < 3, 0.0, skew),
+            "kurtosis": np.where(self.__Counts < 4, 0.0, kurt),
+        }
+
+    def to_frame(self):
+        """
+        Return the columnar table as a pandas DataFrame indexed by key.
+        """
+        import pandas as pd
+        return pd.DataFrame(self.table()).set_index("key")
+
+    def summary(self):
+        """
+        Print a clean and formatted per-group summary.
+        """
+        table = self.table()
+        print("\n📊 Grouped Statistics Summary:")
+        print("-" * 80)
+        print(f"{'Key':<12}{'Count':>8}{'Mean':>10}{'Median':>10}{'Std. Dev':>10}{'Min':>10}{'Max':>10}{'Skew':>10}")
+        for i in range(len(table["key"])):
+            print(f"{str(table['key'][i]):<12}{table['count'][i]:>8}{table['mean'][i]:>10.2f}"
+                  f"{table['median'][i]:>10.2f}{table['std_dev'][i]:>10.2f}{table['min'][i]:>10.2f}"
+                  f"{table['max'][i]:>10.2f}{table['skewness'][i]:>10.4f}")
+        print("-" * 80)
@@ -0,0 +1,216 @@
+## Hashing
+# Vectorized 64-bit hashes and digests shared by the sketches (BloomFilter, HyperLogLog) and Data:
+# hash_array for NumPy arrays, hash_objects for Python values and fingerprint / fingerprints for
+# composite elements.
+# Every hash here is deterministic: the same value gets the same hash in every process.
+
+import hashlib
+
+import numpy as np
+
+
+# Function: hash_array
+# Description: Vectorized 64-bit hash of every element of a 1-D array, or every row of a 2-D array
+# (equal values, equal hashes)
+# - integers, booleans and datetimes hash their value; integral floats hash like the equal integer
+#   (1.0 like 1, -0.0 like 0) and other floats their float64 bits
+# - strings, bytes, other fixed-size dtypes and 2-D rows fold their raw bytes 8 at a time; strings
+#   skip the all-zero padding words, so a string hashes the same whatever the width of its array
+# - the result is mixed with splitmix64, so it spreads well over buckets and Bloom filter bits
+# Unlike hash() of a str, the result does not depend on the interpreter (same in every process).
+def _mix64(z):
+    """
+    splitmix64 finalizer on a uint64 array.
+    """
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def hash_array(values) -> np.ndarray:
+    """
+    Return one uint64 hash per element of a 1-D array (or per row of a 2-D array) with a fixed-size dtype.
+    """
+    values = np.asarray(values)
+    kind = values.dtype.kind
+    if kind == "O":
+        raise TypeError("hash_array needs a fixed-size dtype, not an object array.")
+    if values.ndim not in (1, 2):
+        raise ValueError("hash_array needs a 1-D or 2-D array.")
+    if not len(values):
+        return np.zeros(0, dtype=np.uint64)
+    if values.ndim == 1 and kind in "biu":
+        keys = values.astype(np.int64).view(np.uint64)
+    elif values.ndim == 1 and kind == "f":
+        values = values.astype(np.float64) + 0.0
+        integral = (np.trunc(values) == values) & (np.abs(values) < 2.0 ** 63)
+        keys = values.view(np.uint64).copy()
+        keys[integral] = values[integral].astype(np.int64).view(np.uint64)
+    elif values.ndim == 1 and kind in "mM":
+        keys = values.view(np.int64).view(np.uint64)
+    else:
+        if kind in "fc":
+            values = values + values.dtype.type(0)
+        raw = np.ascontiguousarray(values).view(np.uint8).reshape(len(values), -1)
+        pad = -raw.shape[1] % 8
+        if pad:
+            raw = np.pad(raw, ((0, 0), (0, pad)))
+        words = raw.view(np.uint64)
+        keys = np.zeros(len(values), dtype=np.uint64)
+        padded = values.ndim == 1 and kind in "SU"
+        for j in range(words.shape[1]):
+            mixed = _mix64(keys ^ words[:, j])
+            keys = np.where(words[:, j] != 0, mixed, keys) if padded else mixed
+    return _mix64(keys)
+
+
+# Function: hash_objects
+# Description: 64-bit hashes of a batch of Python objects (lists, tuples, generators of values)
+# - integers, floats and strings are grouped by kind and hashed by hash_array, so a value gets the
+#   same hash in a list and in a NumPy array, whatever else is in the batch
+# - other objects (None, tuples, frozensets, ...) get an 8-byte BLAKE2b digest of a deterministic
+#   encoding; objects of unknown types are encoded by their hash()
+# Unlike hash(), small integers such as -1 and -2 never share a hash.
+def _encode(item) -> str:
+    """
+    Deterministic text encoding of a value (equal values, equal encodings). Lists, arrays, dicts and
+    sets are encoded as their canonical form, so canonical() is not needed first.
+    """
+    cls = type(item)
+    if cls is int:
+        return f"i{item};"
+    if cls is str:
+        return f"s{len(item)}:{item}"
+    if cls is float:
+        return f"i{int(item)};" if item.is_integer() else f"f{item!r};"
+    if cls is tuple or cls is list:
+        return f"t{len(item)}(" + "".join(map(_encode, item)) + ")"
+    if item is None:
+        return "N"
+    if isinstance(item, (bool, int, np.bool_, np.integer)):
+        return f"i{int(item)};"
+    if isinstance(item, (float, np.floating)):
+        return _encode(float(item))
+    if isinstance(item, (complex, np.complexfloating)) and item.imag == 0:
+        return _encode(float(item.real))
+    if isinstance(item, str):
+        return _encode(str(item))
+    if isinstance(item, (bytes, bytearray)):
+        return f"b{len(item)}:{item.hex()}"
+    if isinstance(item, np.ndarray):
+        return _encode(item.tolist())
+    if isinstance(item, (list, tuple)):
+        return _encode(list(item))
+    if isinstance(item, dict):
+        parts = sorted(_encode((k, v)) for k, v in item.items())
+    elif isinstance(item, (set, frozenset)):
+        parts = sorted(map(_encode, item))
+    else:
+        return f"h{hash(item)};"
+    return f"z{len(parts)}(" + "".join(parts) + ")"
+
+
+def _digest(item):
+    """
+    8-byte BLAKE2b digest of the encoding of a value, as an int.
+    """
+    data = _encode(item).encode("utf-8", "surrogatepass")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def _kind(cls):
+    """
+    Group of a Python type in hash_objects: integers, floats, strings or other objects.
+    """
+    if issubclass(cls, (bool, int, np.bool_, np.integer)):
+        return "i"
+    if issubclass(cls, (float, np.floating)):
+        return "f"
+    return "U" if issubclass(cls, str) else "O"
+
+
+def _int_key(value):
+    """
+    Hash of one integer beyond int64: like the equal float when there is one, else its digest.
+    """
+    try:
+        if float(value) == value:
+            return hash_array(np.array([float(value)]))[0]
+    except OverflowError:
+        pass
+    return np.uint64(_digest(value))
+
+
+def _kind_keys(kind, values):
+    """
+    Hashes of a list of values of one kind.
+    """
+    if kind == "i":
+        try:
+            return hash_array(np.array(values, dtype=np.int64))
+        except OverflowError:
+            return np.array([hash_array(np.array([v], dtype=np.int64))[0] if -2 ** 63 <= v < 2 ** 63
+                             else _int_key(v) for v in values], dtype=np.uint64)
+    if kind == "f":
+        return hash_array(np.array(values, dtype=np.float64))
+    if kind == "U":
+        return hash_array(np.array(values, dtype=str))
+    return np.fromiter(map(_digest, values), dtype=np.uint64, count=len(values))
+
+
+def hash_objects(items) -> np.ndarray:
+    """
+    Return one uint64 hash per item of a batch of hashable Python objects.
+    """
+    items = items if isinstance(items, (list, tuple)) else list(items)
+    kinds = {cls: _kind(cls) for cls in set(map(type, items))}
+    if len(set(kinds.values())) <= 1:
+        return _kind_keys(next(iter(kinds.values()), "O"), items)
+    labels = np.array([kinds[type(i)] for i in items])
+    keys = np.empty(len(items), dtype=np.uint64)
+    for kind in set(kinds.values()):
+        index = np.flatnonzero(labels == kind)
+        keys[index] = _kind_keys(kind, [items[i] for i in index.tolist()])
+    return keys
+
+
+# Function: fingerprint / fingerprints
+# Description: Fixed-size digests for unhashable and composite elements (rows, records, arrays)
+# - every element is first put in a canonical hashable form: lists, tuples and arrays become tuples,
+#   sets become frozensets and dicts frozensets of (key, value) pairs, recursively
+#   (so [1, 2], (1, 2) and np.array([1, 2]) are the same element, as when converting by hand)
+# - the digest is the 8-byte BLAKE2b digest of a deterministic encoding of that form (the one used by
+#   hash_objects); rows of a 2-D array are hashed by hash_array instead, without building any Python object
+# Equal elements always get equal digests. Two different elements share one only by a real hash
+# collision (about n² / 2^65 for n distinct elements), which Data can rule out with check_collisions=True.
+def canonical(item):
+    """
+    Return a hashable canonical form of an element.
+    """
+    if isinstance(item, np.ndarray):
+        item = item.tolist()
+    if isinstance(item, (list, tuple)):
+        return tuple(canonical(i) for i in item)
+    if isinstance(item, dict):
+        return frozenset((canonical(k), canonical(v)) for k, v in item.items())
+    if isinstance(item, (set, frozenset)):
+        return frozenset(canonical(i) for i in item)
+    return item
+
+
+def fingerprint(item) -> int:
+    """
+    Return the 64-bit digest of one element (the digest of its canonical form).
+    """
+    return _digest(item)
+
+
+def fingerprints(items) -> np.ndarray:
+    """
+    Return the digests of a collection of elements as a uint64 array (row-wise for 2-D arrays).
+    """
+    if isinstance(items, np.ndarray) and items.ndim == 2 and items.dtype.kind != "O":
+        return hash_array(items)
+    if not hasattr(items, "__len__"):
+        items = list(items)
+    return np.fromiter(map(fingerprint, items), dtype=np.uint64, count=len(items))
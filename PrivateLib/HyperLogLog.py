@@ -0,0 +1,88 @@
+## HyperLogLog Class
+# Approximate distinct count in fixed memory (2^precision one-byte registers, 16 KB by default).
+# Every item gets a 64-bit hash (hash_array for NumPy arrays, hash_objects for Python objects):
+# the first `precision` bits pick a register, which keeps the largest position of the first
+# 1-bit seen in the remaining bits. The estimate is the bias-corrected harmonic mean of 2^register,
+# with linear counting for small cardinalities. Relative standard error ≈ 1.04 / sqrt(registers).
+# Sketches of different chunks merge exactly by taking the register-wise maximum.
+# Example usage:
+# h = HyperLogLog()
+# h.update(np.arange(1_000_000) % 250_000)
+# print(h.get_count())   # Output: ~250000
+
+import math
+
+import numpy as np
+
+from Hashing import hash_array, hash_objects
+
+
+class HyperLogLog:
+    def __init__(self, precision: int = 14):
+        """
+        Initialize an empty sketch with 2^precision registers (4 <= precision <= 18).
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError("Precision must be between 4 and 18.")
+        self.__Precision = precision
+        self.__Registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    # ---------- Private Methods ---------- #
+
+    @staticmethod
+    def __bit_length(x):
+        """
+        Bit length of every uint64 value below 2^64 (exact, via two 32-bit halves).
+        """
+        high = (x >> np.uint64(32)).astype(np.float64)
+        low = (x & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+
+    # ---------- Public Methods ---------- #
+
+    def update_hashes(self, hashes):
+        """
+        Add items given by their 64-bit hashes (uint64 array).
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        tail_bits = 64 - self.__Precision
+        index = (hashes >> np.uint64(tail_bits)).astype(np.intp)
+        tail = hashes & np.uint64((1 << tail_bits) - 1)
+        rank = (tail_bits + 1 - self.__bit_length(tail)).astype(np.uint8)
+        np.maximum.at(self.__Registers, index, rank)
+
+    def update(self, items):
+        """
+        Add a batch of items (NumPy array or any iterable of hashable values).
+        """
+        if isinstance(items, np.ndarray) and items.dtype.kind != "O":
+            self.update_hashes(hash_array(items))
+        else:
+            self.update_hashes(hash_objects(items))
+
+    def merge(self, other):
+        """
+        Merge another sketch of the same precision into this one.
+        """
+        if other.get_precision() != self.__Precision:
+            raise ValueError("Only sketches with the same precision can be merged.")
+        np.maximum(self.__Registers, other.get_registers(), out=self.__Registers)
+        return self
+
+    # ---------- Public Getters ---------- #
+
+    def get_precision(self): return self.__Precision
+    def get_registers(self): return self.__Registers
+    def get_error(self): return 1.04 / math.sqrt(len(self.__Registers))
+
+    def get_count(self):
+        """
+        Estimated number of distinct items.
+        """
+        m = len(self.__Registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / float(np.ldexp(1.0, -self.__Registers.astype(np.int32)).sum())
+        zeros = int(np.count_nonzero(self.__Registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
@@ -0,0 +1,174 @@
+## Hypothesis Tests
+# Batched hypothesis tests for EDA across many feature columns.
+# Every test evaluates all columns of a 2-D array (rows = samples, columns = features) in one
+# vectorized call and returns a (statistics, p_values) pair of NumPy arrays, one entry per column.
+# Column moments come from the shared Moments kernel (or from an existing MultiStats object),
+# so no per-column Python objects are created.
+# Tests:
+#    • t_test / t_test_ind          : one-sample and two-sample (Welch or pooled) t-tests
+#    • z_test / z_test_ind          : one-sample and two-sample z-tests with known σ
+#    • chi_square_test              : goodness of fit, one column of category counts per feature
+#    • chi_square_independence      : independence test for a batch of contingency tables
+#                                     (Yates' correction for 2x2 tables unless correction=False)
+# Requires SciPy (scipy.special) for the t, normal and chi-square tail probabilities.
+# Example usage:
+# data = np.random.normal(0.2, 1, size=(500, 1000))
+# t, p = t_test(data, popmean=0)
+# print((p < 0.05).sum(), "columns reject H0")
+
+import numpy as np
+from scipy import special
+
+from LiteData import Moments
+from MultiStats import MultiStats
+
+ALTERNATIVES = ("two-sided", "less", "greater")
+
+
+# ---------- Private Helpers ---------- #
+
+def _column_moments(data):
+    """
+    Return (n, mean, sample variance) arrays per column, reusing a MultiStats object if given.
+    A 1-D input is treated as a single column.
+    """
+    if isinstance(data, MultiStats):
+        n, mean, var = data.get_count(), data.get_mean(), data.get_variance()
+    else:
+        data = np.asarray(data, dtype=float)
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
+        if data.ndim != 2:
+            raise ValueError("Data must be a 2-D array (rows x columns).")
+        moments = Moments.from_array(data)
+        n, mean, var = moments.get_count(), moments.get_mean(), moments.get_variance()
+    if n < 2:
+        raise ValueError("At least two rows are needed.")
+    return n, np.asarray(mean), np.asarray(var) * n / (n - 1)
+
+
+def _p_value(cdf, sf, alternative):
+    """
+    Combine the lower / upper tail probabilities of the statistic into a p-value.
+    """
+    if alternative == "less":
+        return cdf
+    if alternative == "greater":
+        return sf
+    if alternative == "two-sided":
+        return np.minimum(2 * np.minimum(cdf, sf), 1.0)
+    raise ValueError(f"Alternative must be one of {ALTERNATIVES}.")
+
+
+def _t_result(t, df, alternative):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return t, _p_value(special.stdtr(df, t), special.stdtr(df, -t), alternative)
+
+
+def _z_result(z, alternative):
+    return z, _p_value(special.ndtr(z), special.ndtr(-z), alternative)
+
+
+# ---------- Tests ---------- #
+
+def t_test(data, popmean=0.0, alternative: str = "two-sided"):
+    """
+    One-sample t-test of H0: mean = popmean, for every column.
+    `popmean` may be a scalar or one value per column.
+    """
+    n, mean, var = _column_moments(data)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (mean - popmean) / np.sqrt(var / n)
+    return _t_result(t, n - 1, alternative)
+
+
+def t_test_ind(a, b, equal_var: bool = False, alternative: str = "two-sided"):
+    """
+    Two-sample t-test of H0: mean(a) = mean(b), column by column.
+    Welch's test by default; equal_var=True uses the pooled-variance (Student) test.
+    """
+    na, mean_a, var_a = _column_moments(a)
+    nb, mean_b, var_b = _column_moments(b)
+    if mean_a.shape != mean_b.shape:
+        raise ValueError("Both samples must have the same number of columns.")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if equal_var:
+            df = na + nb - 2
+            pooled = ((na - 1) * var_a + (nb - 1) * var_b) / df
+            se2 = pooled * (1 / na + 1 / nb)
+        else:
+            va, vb = var_a / na, var_b / nb
+            se2 = va + vb
+            df = se2 ** 2 / (va ** 2 / (na - 1) + vb ** 2 / (nb - 1))
+        t = (mean_a - mean_b) / np.sqrt(se2)
+    return _t_result(t, df, alternative)
+
+
+def z_test(data, sigma, popmean=0.0, alternative: str = "two-sided"):
+    """
+    One-sample z-test of H0: mean = popmean with known population σ (scalar or per column).
+    """
+    n, mean, _ = _column_moments(data)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (mean - popmean) / (np.asarray(sigma, dtype=float) / np.sqrt(n))
+    return _z_result(z, alternative)
+
+
+def z_test_ind(a, b, sigma_a, sigma_b, alternative: str = "two-sided"):
+    """
+    Two-sample z-test of H0: mean(a) = mean(b) with known population σ for each sample.
+    """
+    na, mean_a, _ = _column_moments(a)
+    nb, mean_b, _ = _column_moments(b)
+    if mean_a.shape != mean_b.shape:
+        raise ValueError("Both samples must have the same number of columns.")
+    se = np.sqrt(np.asarray(sigma_a, dtype=float) ** 2 / na + np.asarray(sigma_b, dtype=float) ** 2 / nb)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (mean_a - mean_b) / se
+    return _z_result(z, alternative)
+
+
+def chi_square_test(observed, expected=None):
+    """
+    Chi-square goodness-of-fit test for every column of `observed` (categories x features counts).
+    `expected` holds counts or probabilities: a 1-D array shared by all columns or a 2-D array
+    like `observed`. Default: uniform over the categories. Expected values are rescaled to the
+    column totals, and df = categories - 1.
+    """
+    observed = np.asarray(observed, dtype=float)
+    if observed.ndim == 1:
+        observed = observed.reshape(-1, 1)
+    if observed.ndim != 2 or len(observed) < 2:
+        raise ValueError("Observed counts must be a 2-D array with at least two categories.")
+    if expected is None:
+        expected = np.ones(len(observed))
+    expected = np.asarray(expected, dtype=float)
+    if expected.ndim == 1:
+        expected = expected.reshape(-1, 1)
+    expected = expected / expected.sum(axis=0) * observed.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stat = ((observed - expected) ** 2 / expected).sum(axis=0)
+    return stat, special.chdtrc(len(observed) - 1, stat)
+
+
+def chi_square_independence(tables, correction: bool = True):
+    """
+    Chi-square test of independence for a batch of contingency tables, shape (features, rows, cols).
+    A single 2-D table is accepted too. df = (rows - 1)(cols - 1).
+    With correction=True (as scipy.stats.chi2_contingency) Yates' continuity correction is applied
+    when df = 1: every |observed - expected| is reduced by 0.5 (never past zero).
+    """
+    tables = np.asarray(tables, dtype=float)
+    if tables.ndim == 2:
+        tables = tables[None]
+    if tables.ndim != 3 or min(tables.shape[1:]) < 2:
+        raise ValueError("Tables must have shape (features, rows, cols) with at least 2x2 cells.")
+    total = tables.sum(axis=(1, 2), keepdims=True)
+    expected = tables.sum(axis=2, keepdims=True) * tables.sum(axis=1, keepdims=True) / total
+    df = (tables.shape[1] - 1) * (tables.shape[2] - 1)
+    deviation = np.abs(tables - expected)
+    if correction and df == 1:
+        deviation = deviation - np.minimum(0.5, deviation)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stat = (deviation ** 2 / expected).sum(axis=(1, 2))
+    return stat, special.chdtrc(df, stat)
@@ -0,0 +1,93 @@
+## LazyData Class
+# Lazy chain of Data cleaning steps, e.g. Data(x).Lazy().RmNull().Dedupe().Sort().Collect().
+# Steps are only recorded; Collect() runs them as one fused pass: the null mask filters the values
+# once, and Dedupe + Sort become a single np.unique (one sort) instead of a set build and a sort.
+# Dedupe without Sort keeps the first occurrence of every value, in the original order.
+# The three steps commute, so their order in the chain does not change the result.
+# Unlike Data.RmNull / CleanData, the result is an array and duplicates / order are only dropped
+# when asked for. Columns of mixed types stay object arrays and are deduplicated by hashing, so 1 and
+# '1' stay distinct values, as in RmNull.
+
+import numpy as np
+
+from NullMask import NullMask, _as_column
+
+
+class LazyData:
+    STEPS = ("rmnull", "dedupe", "sort")
+
+    def __init__(self, values, sentinels=(), steps=()):
+        """
+        Initialize with the column and the recorded steps (use Data.Lazy()).
+        """
+        self.__Values = values
+        self.__Sentinels = sentinels
+        self.__Steps = tuple(steps)
+
+    # ---------- Private Methods ---------- #
+
+    def __then(self, step):
+        return LazyData(self.__Values, self.__Sentinels, self.__Steps + (step,))
+
+    @staticmethod
+    def __first_occurrences(values):
+        """
+        The first occurrence of every value, in order. Object columns are deduplicated by hashing
+        (like a set), since mixed types cannot be sorted.
+        """
+        if values.dtype.kind != "O":
+            _, first = np.unique(values, return_index=True)
+            return values[np.sort(first)]
+        first = {}
+        for i, value in enumerate(values.tolist()):
+            first.setdefault(value, i)
+        return values[np.fromiter(first.values(), dtype=np.intp, count=len(first))]
+
+    def __filtered(self):
+        if "rmnull" not in self.__Steps:
+            return _as_column(self.__Values)
+        return NullMask(self.__Values, self.__Sentinels).filter()
+
+    # ---------- Public Methods ---------- #
+
+    def RmNull(self): return self.__then("rmnull")
+    def Dedupe(self): return self.__then("dedupe")
+    def Sort(self): return self.__then("sort")
+
+    def get_plan(self) -> list:
+        """
+        The fused operations Collect() will run.
+        """
+        plan = ["null-mask filter"] if "rmnull" in self.__Steps else []
+        dedupe, order = "dedupe" in self.__Steps, "sort" in self.__Steps
+        if dedupe and order:
+            plan.append("np.unique (dedupe + sort)")
+        elif dedupe:
+            plan.append("np.unique first occurrences (order kept)")
+        elif order:
+            plan.append("np.sort")
+        return plan
+
+    def Collect(self) -> np.ndarray:
+        """
+        Run the chain and return the resulting array.
+        """
+        values = self.__filtered()
+        dedupe, order = "dedupe" in self.__Steps, "sort" in self.__Steps
+        if dedupe and order:
+            return np.unique(values) if values.dtype.kind != "O" else np.sort(self.__first_occurrences(values))
+        if dedupe:
+            return self.__first_occurrences(values)
+        if order:
+            return np.sort(values)
+        return values
+
+    def Count(self) -> int:
+        """
+        Number of values the chain would return.
+        """
+        if "dedupe" in self.__Steps:
+            return len(self.__first_occurrences(self.__filtered()))
+        if "rmnull" in self.__Steps:
+            return len(_as_column(self.__Values)) - NullMask(self.__Values, self.__Sentinels).count()
+        return len(_as_column(self.__Values))
@@ -24,16 +24,383 @@
 # =============================================================
 
 import math
+import os
+import re
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from BloomFilter import BloomFilter
+from DataProfile import DataProfile
+from Hashing import canonical, fingerprints, hash_array
+from LazyData import LazyData
+from NullMask import NullMask, _as_column, _null_mask, _object_null_mask, _same_kind_array, _scalar_kind
+from SortedSets import sorted_set_operation
+
+
+# Function: count_syllables
+# Description: Estimates the syllables of a cleaned (lowercase, letters only) word:
+# - counts groups of consecutive vowels (a, e, i, o, u, y)
+# - drops a silent final "e" (but not "-le" as in "table"), minimum one syllable
+# Results are cached for the 65536 most recently used words, which covers the working
+# vocabulary of a corpus while keeping memory bounded on open-ended input.
+_VOWEL_GROUPS = re.compile(r"[aeiouy]+")
+
+@lru_cache(maxsize=1 << 16)
+def count_syllables(word):
+    """
+    Estimate the number of syllables in a lowercase word (cached per word).
+    """
+    count = len(_VOWEL_GROUPS.findall(word))
+    if word.endswith("e") and not word.endswith("le") and count > 1:
+        count -= 1
+    return max(count, 1)
+
+
+# Function: readability_scores
+# Description: Readability scores from word / sentence / letter / syllable counts
+# - Flesch Reading Ease        : 206.835 - 1.015 (words / sentences) - 84.6 (syllables / words)
+# - Flesch-Kincaid Grade       : 0.39 (words / sentences) + 11.8 (syllables / words) - 15.59
+# - SMOG Index                 : 1.043 sqrt(polysyllables * 30 / sentences) + 3.1291
+# - Coleman-Liau Index         : 0.0588 L - 0.296 S - 15.8 (L = letters, S = sentences per 100 words)
+# - Automated Readability Index: 4.71 (letters / words) + 0.5 (words / sentences) - 21.43
+def readability_scores(words, sentences, letters, syllables, polysyllables):
+    """
+    Return the counts and readability scores as a dict (scores are None when there are no words).
+    """
+    result = {
+        "words": words,
+        "sentences": sentences,
+        "letters": letters,
+        "syllables": syllables,
+        "polysyllables": polysyllables,
+    }
+    if not words:
+        for key in ("flesch_reading_ease", "flesch_kincaid_grade", "smog_index",
+                    "coleman_liau_index", "automated_readability_index"):
+            result[key] = None
+        return result
+    sentences = max(sentences, 1)
+    words_per_sentence = words / sentences
+    syllables_per_word = syllables / words
+    result["flesch_reading_ease"] = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+    result["flesch_kincaid_grade"] = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+    result["smog_index"] = 1.043 * math.sqrt(polysyllables * 30 / sentences) + 3.1291
+    result["coleman_liau_index"] = 0.0588 * (100 * letters / words) - 0.296 * (100 * sentences / words) - 15.8
+    result["automated_readability_index"] = 4.71 * letters / words + 0.5 * words_per_sentence - 21.43
+    return result
+
+
+## Vocabulary Class
+# Shared, thread-safe vocabulary for batch text analysis (TextAnalyzer.analyze_many).
+# It keeps the corpus-wide word totals; syllable counts come from the (bounded) count_syllables cache.
+# All access goes through one lock, and callers pass whole batches of distinct words so the
+# lock is taken a few times per document instead of once per token. Per-document counts are
+# queued and folded into the totals every `batch` documents (and whenever the totals are read).
+# Memory is bounded: once the totals hold more than `max_words` distinct words, the least frequent
+# are evicted down to max_words // 2. A word that comes back after eviction starts counting again,
+# so totals are exact until the first eviction and lower bounds afterwards.
+# Example usage:
+# v = Vocabulary(max_words=100_000)
+# TextAnalyzer.analyze_many(texts, vocabulary=v)
+# print(v.get_top_words(10))
+class Vocabulary:
+    def __init__(self, max_words: int = 1 << 20, batch: int = 64):
+        """
+        Initialize an empty vocabulary holding at most `max_words` distinct words.
+        """
+        if max_words < 2 or batch < 1:
+            raise ValueError("max_words must be at least 2 and batch at least 1.")
+        self.__Lock = threading.Lock()
+        self.__MaxWords = max_words
+        self.__Batch = batch
+        self.__Counts = {}
+        self.__Pending = []
+        self.__Evicted = 0
+
+    def syllables(self, words) -> np.ndarray:
+        """
+        Return the syllable count of every word in `words` (count_syllables is thread-safe).
+        """
+        return np.fromiter(map(count_syllables, words), dtype=np.int64, count=len(words))
+
+    def add(self, words, counts):
+        """
+        Queue per-document word counts for the corpus totals.
+        """
+        with self.__Lock:
+            self.__Pending.append((words, counts))
+            if len(self.__Pending) >= self.__Batch:
+                self.__totals()
+
+    # ---------- Private Methods ---------- #
+
+    def __totals(self):
+        """
+        Fold the queued per-document counts into the totals and enforce the size bound
+        (caller holds the lock).
+        """
+        for words, counts in self.__Pending:
+            for word, count in zip(words, counts.tolist()):
+                self.__Counts[word] = self.__Counts.get(word, 0) + count
+        self.__Pending.clear()
+        if len(self.__Counts) > self.__MaxWords:
+            keep = sorted(self.__Counts.items(), key=lambda item: -item[1])[:self.__MaxWords // 2]
+            self.__Evicted += len(self.__Counts) - len(keep)
+            self.__Counts = dict(keep)
+        return self.__Counts
+
+    # ---------- Public Getters ---------- #
+
+    def get_max_words(self): return self.__MaxWords
+
+    def get_size(self):
+        with self.__Lock:
+            return len(self.__totals())
+
+    def get_evicted(self):
+        with self.__Lock:
+            self.__totals()
+            return self.__Evicted
+
+    def get_top_words(self, limit=5):
+        """
+        Corpus-wide most frequent words as (word, count) pairs.
+        """
+        with self.__Lock:
+            items = list(self.__totals().items())
+        items.sort(key=lambda item: -item[1])
+        return items[:limit]
+
+
+# Byte lookup tables for the ASCII fast path of TextAnalyzer.analyze_many
+_ASCII_ALPHA = np.zeros(256, dtype=bool)
+_ASCII_ALPHA[ord("A"):ord("Z") + 1] = _ASCII_ALPHA[ord("a"):ord("z") + 1] = True
+_ASCII_SPACE = np.zeros(256, dtype=bool)
+_ASCII_SPACE[[ord(c) for c in " \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"]] = True  # same set as str.split()
+_ASCII_TERMINATOR = np.zeros(256, dtype=bool)
+_ASCII_TERMINATOR[[ord(c) for c in ".!?"]] = True
+_ASCII_LOWER = np.arange(256, dtype=np.uint8)
+_ASCII_LOWER[ord("A"):ord("Z") + 1] += 32
+# Largest padded word matrix (words x longest word) built by the fast path, in bytes.
+_ASCII_MATRIX_LIMIT = 1 << 26
 
 
 class TextAnalyzer:
+    # Sentence terminators shared by the sentence splitter and the length scan.
+    TERMINATORS = ".!?"
+    # Largest length stored in the uint16 length arrays (longer values saturate).
+    MAX_LENGTH = 65535
+
     def __init__(self, text):
         """
         Constructor: Takes the raw input text and initializes internal state.
+        Words and the word / sentence length arrays are produced by one scan of the text.
         """
         self.original_text = text
-        self.words = self._extract_words(text)
-        self.sentences = self._split_sentences(text)
+        (self.words, self._word_lengths, self._sentence_lengths,
+         self._syllables, self._polysyllables) = self._scan(text)
+        self._sentences = None
+
+    @property
+    def sentences(self):
+        """
+        Sentence strings, split on first use (the length statistics do not need them).
+        """
+        if self._sentences is None:
+            self._sentences = self._split_sentences(self.original_text)
+        return self._sentences
+
+
+# Function: _scan
+# Description: Single pass over the whitespace-separated terms of the text that collects:
+# - the cleaned words (same result as _extract_words)
+# - the length of every word, in a compact uint16 buffer
+# - the number of words of every sentence (same sentences as _split_sentences), in a uint16 buffer
+# - the total syllables and the number of words with 3+ syllables (cached syllable lookup)
+# A term is counted in the sentence that is open when the term starts.
+    def _scan(self, text):
+        """
+        Extract words, word-length and sentence-length buffers and syllable counts in one pass.
+        """
+        words = []
+        word_lengths = array("H")
+        sentence_lengths = array("H")
+        in_sentence = 0
+        pending = False
+        syllables = polysyllables = 0
+        for term in text.split():
+            clean = self._clean_word(term)
+            if clean:
+                words.append(clean)
+                word_lengths.append(min(len(clean), self.MAX_LENGTH))
+                in_sentence += 1
+                n = count_syllables(clean)
+                syllables += n
+                polysyllables += n >= 3
+            ends = term.count(".") + term.count("!") + term.count("?")
+            if ends:
+                sentence_lengths.append(min(in_sentence, self.MAX_LENGTH))
+                sentence_lengths.extend(array("H", [0]) * (ends - 1))
+                in_sentence = 0
+                pending = term[-1] not in self.TERMINATORS
+            else:
+                pending = True
+        if pending:
+            sentence_lengths.append(min(in_sentence, self.MAX_LENGTH))
+        return words, word_lengths, sentence_lengths, syllables, polysyllables
+
+# Function: Length arrays
+# Description: NumPy uint16 views of the buffers filled by _scan (no copy, no Python lists)
+    def get_word_lengths(self):
+        """
+        Length of every word, as a uint16 NumPy array.
+        """
+        return np.frombuffer(self._word_lengths, dtype=np.uint16)
+
+    def get_sentence_lengths(self):
+        """
+        Number of words in every sentence, as a uint16 NumPy array.
+        """
+        return np.frombuffer(self._sentence_lengths, dtype=np.uint16)
+
+    def word_length_stats(self):
+        """
+        Stats of the word-length distribution (mean, median, IQR, skewness, ...).
+        """
+        return Stats(self.get_word_lengths())
+
+    def sentence_length_stats(self):
+        """
+        Stats of the sentence-length distribution, in words.
+        """
+        return Stats(self.get_sentence_lengths())
+
+# Function: readability
+# Description: Readability scores (see readability_scores) from the counts gathered by _scan,
+# without an extra pass over the text
+    def readability(self):
+        """
+        Return the counts and readability scores of the text as a dict.
+        Scores are None when the text has no words.
+        """
+        return readability_scores(len(self.words), len(self._sentence_lengths),
+                                  int(self.get_word_lengths().sum(dtype=np.int64)),
+                                  self._syllables, self._polysyllables)
+
+# Function: analyze_many
+# Description: Thread-safe batch entry point for servers and corpora
+# - Every text gets its own analysis; the only shared state is a lock-protected Vocabulary
+#   (and the cached syllable lookup), so it is safe to call from many threads at once.
+# - Pure-ASCII texts take a NumPy fast path: whitespace / letter / terminator detection,
+#   word and sentence lengths and word counting (np.unique over a padded byte matrix) are all
+#   array operations, which release the GIL on large inputs. Only distinct words reach Python.
+# - Other texts fall back to the regular character-level scan.
+# Returns one result dict per text, in order:
+#   words, sentences, average_word_length, top_words, word_lengths, sentence_lengths, readability
+    @classmethod
+    def analyze_many(cls, texts, executor=None, vocabulary=None, top=5):
+        """
+        Analyze many texts, optionally on a concurrent.futures executor (e.g. ThreadPoolExecutor).
+        A shared Vocabulary collects corpus-wide word counts and syllable lookups.
+        """
+        vocabulary = Vocabulary() if vocabulary is None else vocabulary
+
+        def work(text):
+            result = cls._ascii_analysis(text, vocabulary, top) if text.isascii() else None
+            return result if result is not None else cls._text_analysis(text, vocabulary, top)
+
+        if executor is None:
+            return [work(text) for text in texts]
+        return list(executor.map(work, texts))
+
+    @staticmethod
+    def _batch_result(words, sentence_lengths, word_lengths, distinct, counts, first, vocabulary, top):
+        """
+        Build the analyze_many result from the per-text arrays (shared by both paths).
+        Top words are ordered by count, ties by first occurrence.
+        """
+        vocabulary.add(distinct, counts)
+        syllables = vocabulary.syllables(distinct)
+        order = np.lexsort((first, -counts))[:top]
+        letters = int(word_lengths.sum(dtype=np.int64))
+        return {
+            "words": words,
+            "sentences": len(sentence_lengths),
+            "average_word_length": letters / words if words else 0,
+            "top_words": [(distinct[i], int(counts[i])) for i in order],
+            "word_lengths": word_lengths,
+            "sentence_lengths": sentence_lengths,
+            "readability": readability_scores(words, len(sentence_lengths), letters,
+                                              int((syllables * counts).sum()),
+                                              int(counts[syllables >= 3].sum())),
+        }
+
+    @classmethod
+    def _text_analysis(cls, text, vocabulary, top):
+        """
+        General path: the regular single-pass scan, then the words are counted once per distinct word.
+        """
+        analyzer = cls(text)
+        totals = {}
+        first = {}
+        for i, word in enumerate(analyzer.words):
+            totals[word] = totals.get(word, 0) + 1
+            first.setdefault(word, i)
+        distinct = list(totals)
+        return cls._batch_result(len(analyzer.words), analyzer.get_sentence_lengths(),
+                                 analyzer.get_word_lengths(), distinct,
+                                 np.fromiter(totals.values(), dtype=np.int64, count=len(distinct)),
+                                 np.fromiter(first.values(), dtype=np.int64, count=len(distinct)),
+                                 vocabulary, top)
+
+    @classmethod
+    def _ascii_analysis(cls, text, vocabulary, top):
+        """
+        NumPy fast path for ASCII text; returns None when the padded word matrix would be too large.
+        """
+        buf = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        space = _ASCII_SPACE[buf]
+        alpha = _ASCII_ALPHA[buf]
+        terminator = _ASCII_TERMINATOR[buf]
+        solid = ~space
+        starts = np.flatnonzero(solid & np.concatenate(([True], space[:-1])))
+        ends = np.flatnonzero(solid & np.concatenate((space[1:], [True]))) + 1
+
+        alpha_cum = np.concatenate(([0], np.cumsum(alpha)))
+        term_cum = np.concatenate(([0], np.cumsum(terminator)))
+        letters_per_term = alpha_cum[ends] - alpha_cum[starts]
+        has_word = letters_per_term > 0
+        lengths = letters_per_term[has_word]
+
+        # Sentence of a term = terminators seen before it starts (as in _scan).
+        total_terminators = int(term_cum[-1])
+        last = np.flatnonzero(terminator)
+        pending = bool(solid[last[-1] + 1:].any()) if len(last) else bool(solid.any())
+        sentence_lengths = np.bincount(term_cum[starts][has_word], minlength=total_terminators + pending)
+        sentence_lengths = np.minimum(sentence_lengths, cls.MAX_LENGTH).astype(np.uint16)
+        word_lengths = np.minimum(lengths, cls.MAX_LENGTH).astype(np.uint16)
+
+        words = len(lengths)
+        if not words:
+            return cls._batch_result(0, sentence_lengths, word_lengths, [],
+                                     np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), vocabulary, top)
+        width = int(lengths.max())
+        if words * width > _ASCII_MATRIX_LIMIT:
+            return None
+        # Letters of all words, lowercased and concatenated; row-major fill of the padded matrix
+        # puts every word in its own row, so np.unique can count the words as fixed-width bytes.
+        matrix = np.zeros((words, width), dtype=np.uint8)
+        matrix[np.arange(width) < lengths[:, None]] = _ASCII_LOWER[buf[alpha]]
+        keys = matrix.view(f"S{width}").ravel()
+        unique, first, counts = np.unique(keys, return_index=True, return_counts=True)
+        distinct = unique.astype(f"U{width}").tolist()
+        return cls._batch_result(words, sentence_lengths, word_lengths, distinct, counts, first, vocabulary, top)
 
 
 # Function: _is_letter
@@ -136,8 +503,8 @@ class TextAnalyzer:
         Perform the full text analysis and print the results.
         """
         word_count = len(self.words)
-        sentence_count = len(self.sentences)
-        total_word_length = sum(len(word) for word in self.words)
+        sentence_count = len(self._sentence_lengths)
+        total_word_length = int(self.get_word_lengths().sum(dtype=np.int64))
         avg_word_length = total_word_length / word_count if word_count else 0
 
         most_common_word, freq = self._get_top_words(1)[0] if self.words else ("N/A", 0)
@@ -161,22 +528,726 @@ class TextAnalyzer:
 
 
 
-class Stats:
+## Moments Class
+# This class is the shared, mergeable moment accumulator used by the statistics classes.
+# It keeps count, mean, M2, M3, M4 (sums of powered deviations from the mean), min and max.
+# Blocks are reduced with vectorized NumPy calls and combined with the pairwise update
+# formulas of Chan et al. / Pébay, so data can be fed chunk by chunk (or per worker) and
+# merged without ever holding the whole dataset in memory.
+# A 1-D block gives scalar moments; a 2-D block gives per-column moments (reduced over axis 0).
+# Example usage:
+# m = Moments.from_array([1, 2, 3])
+# m.update([4, 5])
+# print(m.get_mean(), m.get_variance())  # Output: 3.0 2.0
+
+class Moments:
+    def __init__(self):
+        """
+        Initialize an empty accumulator.
+        """
+        self.__Count = 0
+        self.__Mean = 0.0
+        self.__M2 = 0.0
+        self.__M3 = 0.0
+        self.__M4 = 0.0
+        self.__Min = None
+        self.__Max = None
+
+    @classmethod
+    def from_array(cls, block, weights=None):
+        """
+        Build the moments of one block in a single vectorized pass over axis 0.
+        Optional non-negative `weights` (one per row) act as frequency weights: the count
+        becomes the total weight and every sum is weighted.
+        """
+        block = np.asarray(block, dtype=float)
+        result = cls()
+        if len(block) == 0:
+            return result
+        if weights is None:
+            mean = block.mean(axis=0)
+            dev = block - mean
+            dev2 = dev * dev
+            result.__Count = len(block)
+            result.__M2 = dev2.sum(axis=0)
+            result.__M3 = (dev2 * dev).sum(axis=0)
+            result.__M4 = (dev2 * dev2).sum(axis=0)
+        else:
+            weights = np.asarray(weights, dtype=float)
+            total = float(weights.sum())
+            if not total:
+                return result
+            block = block[weights > 0]
+            weights = weights[weights > 0].reshape((-1,) + (1,) * (block.ndim - 1))
+            mean = (weights * block).sum(axis=0) / total
+            dev = block - mean
+            wdev2 = weights * dev * dev
+            result.__Count = int(total) if total.is_integer() else total
+            result.__M2 = wdev2.sum(axis=0)
+            result.__M3 = (wdev2 * dev).sum(axis=0)
+            result.__M4 = (wdev2 * dev * dev).sum(axis=0)
+        result.__Mean = mean
+        result.__Min = block.min(axis=0)
+        result.__Max = block.max(axis=0)
+        return result
+
+    def merge(self, other: "Moments") -> "Moments":
+        """
+        Combine another accumulator into this one (in place) and return self.
+        """
+        if not isinstance(other, Moments):
+            raise TypeError("Can only merge another Moments object.")
+        if other.__Count == 0:
+            return self
+        if self.__Count == 0:
+            self.__Count, self.__Mean, self.__M2, self.__M3, self.__M4 = (
+                other.__Count, other.__Mean, other.__M2, other.__M3, other.__M4)
+            self.__Min, self.__Max = other.__Min, other.__Max
+            return self
+
+        na, nb = self.__Count, other.__Count
+        n = na + nb
+        delta = other.__Mean - self.__Mean
+        d_n = delta / n
+        m2 = self.__M2 + other.__M2 + delta * d_n * na * nb
+        m3 = (self.__M3 + other.__M3 + delta * d_n ** 2 * na * nb * (na - nb)
+              + 3 * d_n * (na * other.__M2 - nb * self.__M2))
+        m4 = (self.__M4 + other.__M4 + delta * d_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+              + 6 * d_n ** 2 * (na * na * other.__M2 + nb * nb * self.__M2)
+              + 4 * d_n * (na * other.__M3 - nb * self.__M3))
+
+        self.__Count = n
+        self.__Mean = self.__Mean + nb * d_n
+        self.__M2, self.__M3, self.__M4 = m2, m3, m4
+        self.__Min = np.minimum(self.__Min, other.__Min)
+        self.__Max = np.maximum(self.__Max, other.__Max)
+        return self
+
+    def update(self, block) -> "Moments":
+        """
+        Accumulate one more block of data and return self.
+        """
+        return self.merge(Moments.from_array(block))
+
+    # ---------- Public Getters ---------- #
+
+    def get_count(self): return self.__Count
+    def get_mean(self): return self.__Mean if self.__Count else None
+    def get_M2(self): return self.__M2
+    def get_M3(self): return self.__M3
+    def get_M4(self): return self.__M4
+    def get_minimum(self): return self.__Min
+    def get_maximum(self): return self.__Max
+
+    def get_variance(self):
+        """
+        Population variance (σ²) = M2 / n.
+        """
+        return self.__M2 / self.__Count if self.__Count else None
+
+    def get_skewness(self):
+        """
+        Skewness = (M3 / n) / σ³.
+        """
+        if not self.__Count:
+            return None
+        return (self.__M3 / self.__Count) / (self.__M2 / self.__Count) ** 1.5
+
+    def get_kurtosis(self):
+        """
+        Excess kurtosis = (M4 / n) / σ⁴ - 3.
+        """
+        if not self.__Count:
+            return None
+        return (self.__M4 / self.__Count) / (self.__M2 / self.__Count) ** 2 - 3
+
+
+
+## FrequencyTable Class
+# This class is the vectorized frequency engine behind Stats.get_mode() and friends.
+# It counts every distinct value without any per-element Python work:
+#    • Already-sorted data (Stats keeps its data sorted): one run-length pass over the array
+#    • Integer data with a small range: np.bincount
+#    • Anything else: np.unique(return_counts=True)
+# It returns the mode(s), the full value counts and the top-K most frequent values.
+# Example usage:
+# f = FrequencyTable([3, 1, 2, 2, 3, 3])
+# print(f.get_mode())      # Output: [3]
+# print(f.get_top_k(2))    # Output: [(3, 3), (2, 2)]
+
+class FrequencyTable:
+    # Integer data spanning at most this many values is counted with np.bincount.
+    BINCOUNT_RANGE = 1 << 20
+
     def __init__(self, data):
+        """
+        Count the distinct values of any 1-D numeric data.
+        """
+        data = np.asarray(data).reshape(-1)
+        if data.dtype.kind in "iu" and len(data):
+            low, high = int(data.min()), int(data.max())
+            if high - low < self.BINCOUNT_RANGE:
+                # Offsets in int64: the span of a small signed dtype can overflow it (int8 -128..127),
+                # and unsigned data never underflows when its own minimum is subtracted.
+                unsigned = data.dtype.kind == "u"
+                offsets = data - data.min() if unsigned else data.astype(np.int64) - low
+                counts = np.bincount(offsets)
+                present = np.flatnonzero(counts)
+                self.__Values = present.astype(data.dtype) + data.min() if unsigned else (present + low).astype(data.dtype)
+                self.__Counts = counts[present]
+                return
+        self.__Values, self.__Counts = np.unique(data, return_counts=True)
+
+    @classmethod
+    def from_sorted(cls, data, weights=None):
+        """
+        Count the distinct values of already-sorted data with a run-length pass (no re-sort).
+        With `weights` (aligned with data) the count of a value is its total weight.
+        """
+        data = np.asarray(data).reshape(-1)
+        result = cls.__new__(cls)
+        if not len(data):
+            result.__Values, result.__Counts = data[:0], np.empty(0, dtype=np.int64)
+            return result
+        change = data[1:] != data[:-1]
+        if data.dtype.kind in "fc":
+            change &= ~(np.isnan(data[1:]) & np.isnan(data[:-1]))
+        starts = np.concatenate(([0], np.flatnonzero(change) + 1))
+        result.__Values = data[starts]
+        if weights is None:
+            result.__Counts = np.diff(np.append(starts, len(data)))
+        else:
+            result.__Counts = np.add.reduceat(np.asarray(weights), starts)
+        return result
+
+    # ---------- Public Getters ---------- #
+
+    def get_values(self): return self.__Values
+    def get_counts(self): return self.__Counts
+    def get_distinct_count(self): return len(self.__Values)
+
+    def get_mode(self) -> list:
+        """
+        Return the mode(s) — every value whose count equals the highest count, in sorted order.
+        """
+        if not len(self.__Counts):
+            return []
+        return self.__Values[self.__Counts == self.__Counts.max()].tolist()
+
+    def get_value_counts(self) -> dict:
+        """
+        Return {value: count} for every distinct value, in sorted value order.
+        """
+        return dict(zip(self.__Values.tolist(), self.__Counts.tolist()))
+
+    def get_top_k(self, k: int) -> list:
+        """
+        Return the k most frequent values as (value, count) pairs.
+        Ties are broken by the smaller value. Only the top-k candidates are fully sorted.
+        """
+        if k <= 0 or not len(self.__Counts):
+            return []
+        if k < len(self.__Counts):
+            candidates = np.argpartition(-self.__Counts, k - 1)[:k]
+        else:
+            candidates = np.arange(len(self.__Counts))
+        # Sorted values mean index order is value order, so lexsort on (index, -count) breaks ties.
+        order = candidates[np.lexsort((candidates, -self.__Counts[candidates]))]
+        return list(zip(self.__Values[order].tolist(), self.__Counts[order].tolist()))
+
+
+
+## HistogramAccumulator Class
+# This class is the binned backend of Stats for massive numeric columns (billions of values).
+# Data is fed chunk by chunk with update(); every chunk is reduced with one np.bincount call, and
+# accumulators built on different workers are combined with merge().
+#    • Integer data with a small range uses an exact bincount fast path (one bin per integer value).
+#    • Otherwise values go into `bins` equal-width bins, with fixed edges (range=(lo, hi)) or
+#      adaptive edges that double their width whenever new data falls outside the current range.
+# Count, mean, variance, skewness, kurtosis, min and max are kept exactly with the Moments kernel;
+# median, quantiles, IQR and mode are answered from the bin counts. get_error_report() gives the
+# bound on the error of the binned answers.
+# Example usage:
+# h = HistogramAccumulator(bins=1000)
+# h.update(np.random.normal(size=1_000_000))
+# s = Stats.from_histogram(h)
+# print(s.get_median(), h.get_error_report()["quantile_error"])
+
+class HistogramAccumulator:
+    def __init__(self, bins: int = 10_000, range: tuple | None = None, exact_int_range: int = 1 << 20):
+        """
+        Initialize an empty accumulator.
+        `range` fixes the bin edges; values outside it are clipped into the first/last bin.
+        Integer data spanning at most `exact_int_range` distinct values is counted exactly.
+        """
+        if bins < 2 or bins % 2:
+            raise ValueError("Number of bins must be an even number of at least 2.")
+        self.__Bins = bins
+        self.__Fixed = range is not None
+        self.__ExactIntRange = exact_int_range
+        self.__Moments = Moments()
+        self.__Clipped = 0
+        self.__MergeError = 0.0
+        if self.__Fixed:
+            if not range[0] < range[1]:
+                raise ValueError("Range must be (low, high) with low < high.")
+            self.__Exact = False
+            self.__Low, self.__Width = float(range[0]), (range[1] - range[0]) / bins
+            self.__Counts = np.zeros(bins, dtype=np.int64)
+        else:
+            self.__Exact = True
+            self.__Low, self.__Width = None, 1.0
+            self.__Counts = np.zeros(0, dtype=np.int64)
+
+    # ---------- Private Methods ---------- #
+
+    def __high(self):
+        return self.__Low + self.__Width * len(self.__Counts)
+
+    def __to_float_bins(self, low, high):
+        """
+        Leave the exact integer mode: re-bin the integer counts into `bins` float bins over [low, high].
+        Every integer sits at a single point, so this re-binning is exact.
+        """
+        values = self.__Low + np.flatnonzero(self.__Counts) if self.__Low is not None else np.empty(0)
+        weights = self.__Counts[self.__Counts > 0]
+        self.__Exact = False
+        self.__Low, self.__Width = float(low), (high - low if high > low else 1.0) / (self.__Bins - 1)
+        self.__Counts = np.zeros(self.__Bins, dtype=np.int64)
+        if len(values):
+            self.__add(values.astype(float), weights)
+
+    def __grow(self, low, high):
+        """
+        Adaptive edges: double the bin width (merging bin pairs) until [low, high] fits in the range.
+        """
+        if not (np.isfinite(low) and np.isfinite(high)):
+            raise ValueError("HistogramAccumulator cannot bin infinite values.")
+        while low < self.__Low or high >= self.__high():
+            merged = self.__Counts.reshape(-1, 2).sum(axis=1)
+            pad = np.zeros(len(merged), dtype=np.int64)
+            if high >= self.__high():
+                self.__Counts = np.concatenate((merged, pad))
+            else:
+                self.__Low -= self.__Width * len(self.__Counts)
+                self.__Counts = np.concatenate((pad, merged))
+            self.__Width *= 2
+
+    def __add(self, values, weights=None):
+        """
+        Add values to the float bins with one bincount call.
+        Bin positions are clipped before the integer cast, so values far outside a fixed range
+        (up to ±inf) land in the first/last bin and are counted as clipped.
+        """
+        idx = np.clip(np.floor((values - self.__Low) / self.__Width), 0, self.__Bins - 1).astype(np.int64)
+        outside = (values < self.__Low) | (values > self.__high())
+        if outside.any():
+            self.__Clipped += int(outside.sum() if weights is None else weights[outside].sum())
+        self.__Counts += np.bincount(idx, weights=weights, minlength=self.__Bins).astype(np.int64)
+
+    def __rebase(self, low, high):
+        """
+        Exact integer mode: re-base the counters so they cover every integer in [low, high].
+        """
+        if self.__Low is not None:
+            low, high = min(low, self.__Low), max(high, self.__Low + len(self.__Counts) - 1)
+            if low == self.__Low and high == self.__Low + len(self.__Counts) - 1:
+                return
+        counts = np.zeros(int(high - low) + 1, dtype=np.int64)
+        if self.__Low is not None:
+            start = int(self.__Low - low)
+            counts[start:start + len(self.__Counts)] = self.__Counts
+        self.__Low, self.__Counts = int(low), counts
+
+    def __add_exact(self, values):
+        """
+        Exact integer fast path: one counter per integer value, filled with one bincount call.
+        """
+        self.__rebase(int(values.min()), int(values.max()))
+        # Offsets in int64 (a small dtype cannot hold the span); unsigned values above the base
+        # are subtracted in their own dtype so uint64 beyond the int64 range still works.
+        if values.dtype.kind == "u" and self.__Low >= 0:
+            offsets = (values - values.dtype.type(self.__Low)).astype(np.int64)
+        else:
+            offsets = values.astype(np.int64) - self.__Low
+        self.__Counts += np.bincount(offsets, minlength=len(self.__Counts))
+
+    # ---------- Public Methods ---------- #
+
+    def update(self, block) -> "HistogramAccumulator":
+        """
+        Accumulate one chunk of data (NaN values are skipped) and return self.
+        Infinite values have no bin and raise a ValueError.
+        """
+        block = np.asarray(block).reshape(-1)
+        if block.dtype.kind == "f":
+            block = block[~np.isnan(block)]
+            if np.isinf(block).any():
+                raise ValueError("HistogramAccumulator cannot bin infinite values.")
+        if not len(block):
+            return self
+        self.__Moments.update(block)
+        low, high = float(block.min()), float(block.max())
+
+        if self.__Exact:
+            integral = block.dtype.kind in "iub" or bool(np.all(block == np.floor(block)))
+            span_low = low if self.__Low is None else min(low, self.__Low)
+            span_high = high if self.__Low is None else max(high, self.__high() - 1)
+            if integral and span_high - span_low < self.__ExactIntRange:
+                self.__add_exact(block)
+                return self
+            self.__to_float_bins(span_low, span_high)
+
+        if not self.__Fixed:
+            self.__grow(low, high)
+        self.__add(block.astype(float))
+        return self
+
+    def merge(self, other: "HistogramAccumulator") -> "HistogramAccumulator":
+        """
+        Combine an accumulator from another worker into this one (in place) and return self.
+        Exact counters and identical edges add counts exactly; otherwise the other bins are
+        re-binned at their midpoints, which widens the quantile error bound by half their width.
+        """
+        if not isinstance(other, HistogramAccumulator):
+            raise TypeError("Can only merge another HistogramAccumulator.")
+        if not other.__Moments.get_count():
+            return self
+        moments = Moments().merge(self.__Moments).merge(other.__Moments)
+        low, high = float(moments.get_minimum()), float(moments.get_maximum())
+
+        if self.__Exact and other.__Exact and high - low < self.__ExactIntRange:
+            self.__rebase(int(low), int(high))
+            start = int(other.__Low - self.__Low)
+            self.__Counts[start:start + len(other.__Counts)] += other.__Counts
+        elif (not self.__Exact and not other.__Exact and self.__Low == other.__Low
+              and self.__Width == other.__Width and len(self.__Counts) == len(other.__Counts)):
+            self.__Counts += other.__Counts
+            self.__MergeError = max(self.__MergeError, other.__MergeError)
+        else:
+            if self.__Exact:
+                self.__to_float_bins(low, high)
+            filled = np.flatnonzero(other.__Counts)
+            if other.__Exact:
+                points = other.__Low + filled.astype(float)
+            else:
+                points = other.__Low + (filled + 0.5) * other.__Width
+                self.__MergeError = max(self.__MergeError, other.__MergeError + other.__Width / 2)
+            if not self.__Fixed:
+                self.__grow(points.min(), points.max())
+            self.__add(points, other.__Counts[filled])
+        self.__Clipped += other.__Clipped
+        self.__Moments = moments
+        return self
+
+    def select(self, k):
+        """
+        Return an estimate of the k-th smallest value (0-based).
+        Exact in integer mode; otherwise interpolated inside the bin holding rank k.
+        """
+        cumulative = np.cumsum(self.__Counts)
+        b = int(np.searchsorted(cumulative, k, side="right"))
+        if self.__Exact:
+            return int(self.__Low + b)
+        before = cumulative[b - 1] if b else 0
+        value = self.__Low + (b + (k - before + 0.5) / self.__Counts[b]) * self.__Width
+        return float(min(max(value, self.__Moments.get_minimum()), self.__Moments.get_maximum()))
+
+    def get_mode(self) -> list:
+        """
+        Return the mode(s): exact values in integer mode, otherwise the midpoints of the fullest bins.
+        """
+        if not self.__Moments.get_count():
+            return []
+        top = np.flatnonzero(self.__Counts == self.__Counts.max())
+        if self.__Exact:
+            return (self.__Low + top).tolist()
+        return (self.__Low + (top + 0.5) * self.__Width).tolist()
+
+    # ---------- Public Getters ---------- #
+
+    def get_moments(self): return self.__Moments
+    def get_counts(self): return self.__Counts
+    def is_exact(self): return self.__Exact
+
+    def get_edges(self):
+        """
+        Bin edges (len(counts) + 1 values); integer bins are centred on their value.
+        """
+        if self.__Low is None:
+            return np.empty(0)
+        offset = 0.5 if self.__Exact else 0.0
+        return self.__Low - offset + self.__Width * np.arange(len(self.__Counts) + 1)
+
+    def get_error_report(self) -> dict:
+        """
+        Bounds on the error of the binned answers.
+        - quantile_error: max absolute error of any order statistic (median, quartiles, IQR ends)
+        - mode_error: max distance between the reported mode and the true centre of its bin
+        - moments: count, mean, variance, skewness, kurtosis, min and max are exact
+        - clipped: values outside a fixed range that were counted in the first/last bin
+        """
+        if self.__Exact:
+            return {"exact": True, "bin_width": 1.0, "quantile_error": 0.0, "mode_error": 0.0,
+                    "moments": "exact", "clipped": 0}
+        return {"exact": False, "bin_width": self.__Width,
+                "quantile_error": self.__Width + self.__MergeError,
+                "mode_error": self.__Width / 2 + self.__MergeError,
+                "moments": "exact", "clipped": self.__Clipped}
+
+
+
+class Stats:
+    # Number of histogram bins per refinement pass when selecting order statistics from a stream.
+    SELECT_BINS = 4096
+
+    def __init__(self, data, weights=None):
         """
         Initialize the statistics object with numerical data.
         Data is sorted to simplify median, IQR, and percentile-based calculations.
+        Optional `weights` turn pre-aggregated (value, weight) pairs into weighted statistics
+        without expanding them: every metric behaves as if each value appeared `weight` times
+        (exactly so for integer weights), and the data length is the total weight.
         """
-        self.__Data = sorted(data)
-        self.__DataLength = len(data)
+        self.__Chunks = None
+        self.__ChunkSize = None
+        self.__Histogram = None
+        self.__Cache = {}
+        if weights is None:
+            self.__Data = np.sort(np.asarray(data))
+            self.__Weights = None
+            self.__CumWeights = None
+            self.__DataLength = len(self.__Data)
+            self.__Moments = Moments.from_array(self.__Data)
+            return
+
+        values = np.asarray(data).reshape(-1)
+        weights = np.asarray(weights).reshape(-1)
+        if len(values) != len(weights):
+            raise ValueError("Data and weights must have the same length.")
+        if len(weights) and (not np.all(np.isfinite(weights)) or weights.min() < 0):
+            raise ValueError("Weights must be finite and non-negative.")
+        keep = weights > 0
+        order = np.argsort(values[keep], kind="stable")
+        self.__Data = values[keep][order]
+        self.__Weights = weights[keep][order]
+        self.__CumWeights = np.cumsum(self.__Weights)
+        self.__Moments = Moments.from_array(self.__Data, self.__Weights)
+        self.__DataLength = self.__Moments.get_count()
+
+    # ---------- Out-of-core Constructors ---------- #
+
+    @classmethod
+    def __from_chunks(cls, chunks, chunksize, backend="exact", bins=10_000):
+        """
+        Build a streamed Stats object from a callable that returns a fresh iterator of 1-D chunks.
+        Only mergeable moments are kept; the column is never held in memory as a whole.
+        backend="histogram" reads the data once into a HistogramAccumulator instead of
+        re-reading it for exact quantiles.
+        """
+        if backend == "histogram":
+            histogram = HistogramAccumulator(bins)
+            for block in chunks():
+                histogram.update(block)
+            return cls.from_histogram(histogram)
+        if backend != "exact":
+            raise ValueError("Backend must be 'exact' or 'histogram'.")
+        result = cls.__new__(cls)
+        result.__Data = None
+        result.__Weights = None
+        result.__Chunks = chunks
+        result.__ChunkSize = chunksize
+        result.__Histogram = None
+        result.__Cache = {}
+        result.__Moments = Moments()
+        for block in chunks():
+            result.__Moments.update(block)
+        result.__DataLength = result.__Moments.get_count()
+        return result
+
+    @classmethod
+    def from_histogram(cls, histogram: "HistogramAccumulator"):
+        """
+        Build a Stats object answered from a HistogramAccumulator (binned backend).
+        Moments, min and max are exact; median, IQR and mode come from the bin counts.
+        """
+        if not isinstance(histogram, HistogramAccumulator):
+            raise TypeError("Expected a HistogramAccumulator.")
+        result = cls.__new__(cls)
+        result.__Data = None
+        result.__Weights = None
+        result.__Chunks = None
+        result.__ChunkSize = None
+        result.__Histogram = histogram
+        result.__Cache = {}
+        result.__Moments = histogram.get_moments()
+        result.__DataLength = result.__Moments.get_count()
+        return result
+
+    @classmethod
+    def from_npy(cls, path, mmap_mode="r", chunksize: int = 1_000_000, backend="exact", bins=10_000):
+        """
+        Stream a column stored in a .npy file through memory mapping, `chunksize` values at a time.
+        NaN values are treated as missing values and skipped.
+        """
+        if chunksize < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        column = np.load(path, mmap_mode=mmap_mode).reshape(-1)
+
+        def chunks():
+            for i in range(0, len(column), chunksize):
+                values = np.asarray(column[i:i + chunksize], dtype=float)
+                yield values[~np.isnan(values)]
+
+        return cls.__from_chunks(chunks, chunksize, backend, bins)
+
+    @classmethod
+    def from_csv(cls, path, column=0, chunksize: int = 100_000, backend="exact", bins=10_000, **read_csv_kwargs):
+        """
+        Stream one column of a CSV file (name or position) `chunksize` rows at a time.
+        Empty cells are treated as missing values and skipped.
+        """
+        import pandas as pd
+        if chunksize < 1:
+            raise ValueError("Chunk size must be at least 1.")
+
+        def chunks():
+            reader = pd.read_csv(path, usecols=[column], chunksize=chunksize, **read_csv_kwargs)
+            for frame in reader:
+                values = frame.iloc[:, 0].to_numpy(dtype=float)
+                yield values[~np.isnan(values)]
+
+        return cls.__from_chunks(chunks, chunksize, backend, bins)
+
+    # ---------- Mutation ---------- #
+
+    def append(self, value, weight=None):
+        """
+        Add one value (with its weight for weighted Stats).
+        """
+        self.extend([value], None if weight is None else [weight])
+
+    def extend(self, values, weights=None):
+        """
+        Add several values (with their weights for weighted Stats).
+        The moments are merged incrementally, new values are inserted into the sorted data
+        (no full re-sort), and every cached result is invalidated.
+        Histogram-backed Stats feed the values to their accumulator; file-backed Stats are read-only.
+        """
+        values = np.asarray(values).reshape(-1)
+        if not len(values):
+            return
+        if self.__Histogram is not None:
+            if weights is not None:
+                raise ValueError("Histogram-backed Stats do not take weights.")
+            self.__Histogram.update(values)
+            self.__Moments = self.__Histogram.get_moments()
+        elif self.__Data is None:
+            raise TypeError("Stats streamed from a file cannot be extended.")
+        elif (weights is None) != (self.__Weights is None):
+            raise ValueError("Weights must be given exactly when the Stats object is weighted.")
+        else:
+            if weights is not None:
+                weights = np.asarray(weights).reshape(-1)
+                if len(weights) != len(values):
+                    raise ValueError("Data and weights must have the same length.")
+                if not np.all(np.isfinite(weights)) or weights.min() < 0:
+                    raise ValueError("Weights must be finite and non-negative.")
+                values, weights = values[weights > 0], weights[weights > 0]
+            order = np.argsort(values, kind="stable")
+            values = values[order]
+            dtype = np.result_type(self.__Data, values) if len(self.__Data) else values.dtype
+            position = np.searchsorted(self.__Data, values, side="right")
+            self.__Data = np.insert(self.__Data.astype(dtype, copy=False), position, values)
+            if weights is None:
+                self.__Moments.merge(Moments.from_array(values))
+            else:
+                weights = weights[order]
+                self.__Weights = np.insert(self.__Weights.astype(np.result_type(self.__Weights, weights), copy=False),
+                                           position, weights)
+                self.__CumWeights = np.cumsum(self.__Weights)
+                self.__Moments.merge(Moments.from_array(values, weights))
+        self.__DataLength = self.__Moments.get_count()
+        self.__Cache.clear()
 
     # ---------- Private Methods ---------- #
 
+    def __cached(self, key, compute):
+        """
+        Return the memoized result stored under `key`, computing it on first use.
+        The cache lives as long as the data does not change (see extend()).
+        """
+        if key not in self.__Cache:
+            self.__Cache[key] = compute()
+        return self.__Cache[key]
+
+    def __stream_select(self, k):
+        """
+        Return the k-th smallest value (0-based) of a streamed column, exactly.
+        Each pass builds a histogram of the candidate value range and keeps the bin that holds
+        rank k (tracking the true min/max of every bin); once that bin holds at most `chunksize`
+        values they are collected and sorted. Memory stays bounded by the chunk size.
+        Infinite values are only counted: -inf ranks below and +inf above every finite value.
+        """
+        lo, hi = self.__Moments.get_minimum(), self.__Moments.get_maximum()
+        if not (np.isfinite(lo) and np.isfinite(hi)):
+            below = above = 0
+            lo, hi = np.inf, -np.inf
+            for block in self.__Chunks():
+                below += int(np.count_nonzero(block == -np.inf))
+                above += int(np.count_nonzero(block == np.inf))
+                finite = block[np.isfinite(block)]
+                if len(finite):
+                    lo, hi = min(lo, finite.min()), max(hi, finite.max())
+            if k < below:
+                return -np.inf
+            if k >= self.__DataLength - above:
+                return np.inf
+        bins = self.SELECT_BINS
+        while True:
+            if lo == hi:
+                return float(lo)
+            below = 0
+            counts = np.zeros(bins, dtype=np.int64)
+            bin_min = np.full(bins, np.inf)
+            bin_max = np.full(bins, -np.inf)
+            for block in self.__Chunks():
+                below += int(np.count_nonzero(block < lo))
+                inside = block[(block >= lo) & (block <= hi)]
+                idx = np.minimum(((inside - lo) / (hi - lo) * bins).astype(np.int64), bins - 1)
+                counts += np.bincount(idx, minlength=bins)
+                np.minimum.at(bin_min, idx, inside)
+                np.maximum.at(bin_max, idx, inside)
+            b = int(np.searchsorted(np.cumsum(counts), k - below, side="right"))
+            lo, hi = bin_min[b], bin_max[b]
+            if counts[b] <= self.__ChunkSize:
+                break
+
+        below = 0
+        collected = []
+        for block in self.__Chunks():
+            below += int(np.count_nonzero(block < lo))
+            collected.append(block[(block >= lo) & (block <= hi)])
+        return float(np.sort(np.concatenate(collected))[k - below])
+
+    def __select(self, k):
+        """
+        Return the k-th smallest value (0-based) of the dataset.
+        """
+        if self.__Weights is not None:
+            return self.__Data[int(np.searchsorted(self.__CumWeights, k, side="right"))].item()
+        if self.__Data is not None:
+            return self.__Data[k].item()
+        if self.__Histogram is not None:
+            return self.__Histogram.select(k)
+        # Every streamed order statistic costs passes over the file, so they are memoized.
+        return self.__cached(("select", k), lambda: self.__stream_select(k))
+
     def __mean(self):
         """
         Compute the arithmetic mean (average) of the dataset.
         """
-        return sum(self.__Data) / self.__DataLength if self.__DataLength else None
+        return float(self.__Moments.get_mean()) if self.__DataLength else None
 
     def __median(self):
         """
@@ -185,21 +1256,35 @@ class Stats:
         """
         if not self.__DataLength:
             return None
+        if self.__Weights is not None:
+            # Weighted median: first value whose cumulative weight reaches half the total,
+            # averaged with the next value when the total splits exactly at its boundary.
+            half = self.__DataLength / 2
+            i = int(np.searchsorted(self.__CumWeights, half, side="left"))
+            if self.__CumWeights[i] == half and i + 1 < len(self.__Data):
+                return (self.__Data[i].item() + self.__Data[i + 1].item()) / 2
+            return self.__Data[i].item()
         mid = self.__DataLength // 2
-        return self.__Data[mid] if self.__DataLength % 2 else (self.__Data[mid - 1] + self.__Data[mid]) / 2
+        return self.__select(mid) if self.__DataLength % 2 else (self.__select(mid - 1) + self.__select(mid)) / 2
 
     def __mode(self):
         """
         Compute the mode(s) — the most frequent value(s) in the dataset.
         Returns a list to handle multimodal distributions.
+        Streamed columns do not keep a count per distinct value, so their mode is None
+        (unless they use the histogram backend).
         """
-        if not self.__DataLength:
-            return []
-        freq = {}
-        for val in self.__Data:
-            freq[val] = freq.get(val, 0) + 1
-        max_count = max(freq.values())
-        return [val for val, count in freq.items() if count == max_count]
+        if self.__Data is None:
+            return self.__Histogram.get_mode() if self.__Histogram is not None else None
+        return self.__cached("frequency", self.__frequency).get_mode()
+
+    def __frequency(self):
+        """
+        Build the frequency table of the sorted data with one run-length pass.
+        """
+        if self.__Data is None:
+            raise ValueError("Value counts need the data in memory; streamed Stats do not keep them.")
+        return FrequencyTable.from_sorted(self.__Data, self.__Weights)
 
     def __variance(self):
         """
@@ -207,33 +1292,47 @@ class Stats:
         """
         if not self.__DataLength:
             return None
-        mean_val = self.__mean()
-        return sum((x - mean_val) ** 2 for x in self.__Data) / self.__DataLength
+        return float(self.__Moments.get_variance())
 
     def __std_dev(self):
         """
         Calculate the standard deviation (σ) — square root of variance.
         """
-        var = self.__variance()
+        var = self.get_variance()
         return math.sqrt(var) if var is not None else None
 
     def __minimum(self):
         """
         Return the smallest value in the dataset.
         """
-        return min(self.__Data) if self.__DataLength else None
+        if not self.__DataLength:
+            return None
+        return self.__Data[0].item() if self.__Data is not None else float(self.__Moments.get_minimum())
 
     def __maximum(self):
         """
         Return the largest value in the dataset.
         """
-        return max(self.__Data) if self.__DataLength else None
+        if not self.__DataLength:
+            return None
+        return self.__Data[-1].item() if self.__Data is not None else float(self.__Moments.get_maximum())
 
     def __range_val(self):
         """
         Calculate the range: difference between max and min.
         """
-        return self.__maximum() - self.__minimum() if self.__DataLength else None
+        return self.get_maximum() - self.get_minimum() if self.__DataLength else None
+
+    def __percentile(self, p):
+        """
+        Percentile with linear interpolation between order statistics (rank = p(n + 1) / 100),
+        the convention used by the IQR. Ranks outside [1, n] are clamped to the min/max.
+        """
+        rank = min(max(p * (self.__DataLength + 1) / 100, 1), self.__DataLength)
+        k = int(rank)
+        d = rank - k
+        low = self.__select(k - 1)
+        return (low if k == self.__DataLength else low + d * (self.__select(k) - low))
 
     def __iqr(self):
         """
@@ -242,15 +1341,8 @@ class Stats:
         """
         if self.__DataLength < 4:
             return 0
-
-        def percentile(p):
-            rank = p * (self.__DataLength + 1) / 100
-            k = int(rank)
-            d = rank - k
-            return (self.__Data[k - 1] if k == self.__DataLength else self.__Data[k - 1] + d * (self.__Data[k] - self.__Data[k - 1]))
-
-        q1 = percentile(25)
-        q3 = percentile(75)
+        q1 = self.get_percentile(25)
+        q3 = self.get_percentile(75)
         return q3 - q1
 
     def __skewness(self):
@@ -260,9 +1352,9 @@ class Stats:
         """
         if self.__DataLength < 3:
             return 0
-        m = self.__mean()
-        sd = self.__std_dev()
-        return (sum((x - m) ** 3 for x in self.__Data) / self.__DataLength) / (sd ** 3)
+        sd = np.float64(self.get_std_dev())
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return float(self.__Moments.get_M3() / self.__DataLength / sd ** 3)
 
     def __kurtosis(self):
         """
@@ -272,29 +1364,38 @@ class Stats:
         """
         if self.__DataLength < 4:
             return 0
-        m = self.__mean()
-        sd = self.__std_dev()
-        return (sum((x - m) ** 4 for x in self.__Data) / self.__DataLength) / (sd ** 4) - 3
+        var = np.float64(self.get_variance())
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return float(self.__Moments.get_M4() / self.__DataLength / var ** 2 - 3)
 
     # ---------- Public Getters ---------- #
 
-    def get_DataSort(self): return self.__Data
+    def get_DataSort(self): return self.__Data.tolist() if self.__Data is not None else None
+    def get_DataArray(self): return self.__Data
+    def get_weights(self): return self.__Weights
     def get_DataLength(self): return self.__DataLength
+    def get_moments(self): return self.__Moments
+    def is_streamed(self): return self.__Data is None
+    def get_histogram(self): return self.__Histogram
 
-    def get_mean(self): return self.__mean()
-    def get_median(self): return self.__median()
+    def get_mean(self): return self.__cached("mean", self.__mean)
+    def get_median(self): return self.__cached("median", self.__median)
     def get_mode(self): return self.__mode()
+    def get_value_counts(self): return self.__cached("frequency", self.__frequency).get_value_counts()
+    def get_top_values(self, k=5): return self.__cached("frequency", self.__frequency).get_top_k(k)
 
-    def get_variance(self): return self.__variance()
-    def get_std_dev(self): return self.__std_dev()
+    def get_variance(self): return self.__cached("variance", self.__variance)
+    def get_std_dev(self): return self.__cached("std_dev", self.__std_dev)
     
-    def get_minimum(self): return self.__minimum()
-    def get_maximum(self): return self.__maximum()
-    def get_range(self): return self.__range_val()
+    def get_minimum(self): return self.__cached("minimum", self.__minimum)
+    def get_maximum(self): return self.__cached("maximum", self.__maximum)
+    def get_range(self): return self.__cached("range", self.__range_val)
 
-    def get_iqr(self): return self.__iqr()
-    def get_skewness(self): return self.__skewness()
-    def get_kurtosis(self): return self.__kurtosis()
+    def get_iqr(self): return self.__cached("iqr", self.__iqr)
+    def get_percentile(self, p):
+        return self.__cached(("percentile", p), lambda: self.__percentile(p)) if self.__DataLength else None
+    def get_skewness(self): return self.__cached("skewness", self.__skewness)
+    def get_kurtosis(self): return self.__cached("kurtosis", self.__kurtosis)
 
     def summary(self):
         """
@@ -318,28 +1419,361 @@ class Stats:
 
 
 
+def _sorted_repeats(ordered):
+    """
+    Distinct values that occur more than once in a sorted array (adjacent equal values).
+    """
+    repeat = ordered[1:] == ordered[:-1]
+    first = repeat & np.concatenate(([True], ~repeat[:-1]))
+    return ordered[1:][first]
+
+
+# Function: parallel duplicate detection (Data.ReturnDuplicates with workers > 1)
+# Description: Hash partitioning across processes
+# - NumPy values are copied once into shared memory; workers attach to it by name (no pickling)
+# - phase 1: every worker hashes its slice and writes the bucket ids (hash mod N) to a shared array
+# - phase 2: worker b sorts only the values of bucket b and returns their duplicates
+# Equal values always land in the same bucket, so the union of the per-bucket results is exact.
+# Python lists of same-kind scalars (int, float or str) are converted to an array first; other Python
+# collections are refused, since partitioning them in the parent costs as much as the serial `seen` set.
+def _attach(name, shape, dtype):
+    shm = SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _bucket_worker(values_spec, buckets_spec, start, stop, parts):
+    values_shm, values = _attach(*values_spec)
+    buckets_shm, buckets = _attach(*buckets_spec)
+    try:
+        buckets[start:stop] = hash_array(values[start:stop]) % np.uint64(parts)
+    finally:
+        del values, buckets
+        values_shm.close()
+        buckets_shm.close()
+
+
+def _bucket_duplicates_worker(values_spec, buckets_spec, bucket):
+    values_shm, values = _attach(*values_spec)
+    buckets_shm, buckets = _attach(*buckets_spec)
+    try:
+        return _sorted_repeats(np.sort(values[buckets == bucket]))
+    finally:
+        del values, buckets
+        values_shm.close()
+        buckets_shm.close()
+
+
+def _shared_duplicates(values, workers):
+    """
+    Duplicates of a 1-D array found by `workers` processes over shared memory.
+    """
+    bucket_type = np.uint8 if workers <= 256 else np.uint16
+    values_shm = SharedMemory(create=True, size=max(values.nbytes, 1))
+    buckets_shm = SharedMemory(create=True, size=max(len(values), 1) * np.dtype(bucket_type).itemsize)
+    try:
+        shared = np.ndarray(values.shape, dtype=values.dtype, buffer=values_shm.buf)
+        shared[:] = values
+        del shared
+        values_spec = [(values_shm.name, values.shape, values.dtype)] * workers
+        buckets_spec = [(buckets_shm.name, (len(values),), bucket_type)] * workers
+        bounds = np.linspace(0, len(values), workers + 1).astype(int).tolist()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_bucket_worker, values_spec, buckets_spec, bounds[:-1], bounds[1:], [workers] * workers))
+            parts = list(pool.map(_bucket_duplicates_worker, values_spec, buckets_spec, range(workers)))
+        return np.concatenate(parts)
+    finally:
+        values_shm.close()
+        values_shm.unlink()
+        buckets_shm.close()
+        buckets_shm.unlink()
+
+
 ## Data Class
 # This class is designed to handle a collection of data and check for duplicates.
-# It can accept data in the form of a set, list, or tuple.
+# It can accept data in the form of a set, list, or tuple, or a 1-D NumPy array / pandas Series.
 # The DuplicateCheck method checks if there are any duplicate elements in the data.
 # It returns True if duplicates are found, otherwise False.
 # The ReturnDuplicates method returns a set of duplicate elements if any are found, otherwise None.
 # The NullCheck method checks if there are any None values in the data.
 # The IsEmpty method checks if the data is empty.
 # The __str__ method returns a string representation of the data.
+# Arrays and Series (numeric, string, bool or datetime dtypes) use a vectorized backend:
+# one np.sort with an adjacent-difference check replaces the per-item `seen` set, and missing
+# values (None, NaN, NaT) come from an isnan / isnat mask. Results keep the set / list types
+# (datetime / timedelta values come back as NumPy scalars, as when iterating the array),
+# and missing values are reported as None, exactly like None in a list.
+# Object arrays and object / string Series get an explicit null mask (Series.isnull(), or None / NaN
+# items): the missing rows are dropped and the rest use the array backend when they share one kind
+# (e.g. all strings), or the per-item path with the missing values as None otherwise.
+# DuplicateCheck / ReturnDuplicates also have an approximate mode for collections or one-shot
+# generators too large for a `seen` set: a BloomFilter of fixed size (capacity x error_rate) finds
+# candidate duplicates, and an optional second exact pass (verify=True) counts only the candidates
+# to drop false positives. Without verification the result can contain false positives, never misses.
+# For files of values too large for memory, ExternalSort gives the CleanData result as a stream.
+# With workers > 1, duplicate detection is hash-partitioned across processes over shared memory (arrays,
+# Series and lists of same-kind scalars; other collections raise a ValueError).
+# Unhashable or composite elements (lists, dicts, small arrays as rows, or the rows of a 2-D array /
+# DataFrame) use fingerprints: every element is reduced to a 64-bit digest and duplicates / unique
+# values are found on the digest array. Results hold the canonical forms (lists -> tuples, dicts ->
+# frozensets of items). check_collisions=True compares the canonical forms of elements that share
+# a digest, so a hash collision can never merge two different elements.
+# data = Data([[1, 2], [3, 4], [1, 2]], fingerprint=True)
+# print(data.ReturnDuplicates())  # Output: {(1, 2)}
+# print(Data([[-1, 5], [-2, 5]], fingerprint=True).ReturnDuplicates())  # Output: None (hash(-1) == hash(-2))
+# The Profile method gives size, nulls, approximate distinct count, duplicate ratio and top values
+# in one pass (DataProfile), instead of separate IsEmpty / NullCheck / UniqueData passes.
+# NullMask / DropNull keep the values with a (optionally bit-packed) missing-value mask that also
+# understands sentinel values, and Lazy() chains RmNull -> Dedupe -> Sort into one fused pass:
+# print(Data([3, None, 2, -1, 2]).Lazy(sentinels=(-1,)).RmNull().Dedupe().Sort().Collect())  # [2 3]
+# Union / Intersection / Difference merge the sorted CleanData arrays of two Data objects (or sorted
+# arrays, memory-mapped .npy files) without hashing; see sorted_set_operation.
+# print(Data([3, 1, 2]).Intersection(Data([2, 3, 4])))  # Output: [2 3]
 # Example usage:
 # data = Data([1, 2, 3, 4, 5, 1, 2])
 # print(data.DuplicateCheck())  # Output: True
 # print(data.ReturnDuplicates())  # Output: {1, 2}
-
-import numpy as np
+# print(Data(np.array([3.0, np.nan, 1.0, 3.0])).CleanData())  # Output: [1.0, 3.0]
 
 class Data:
     
-    def __init__(self, data : set | list | tuple):
+    def __init__(self, data : set | list | tuple | np.ndarray, fingerprint: bool = False,
+                 check_collisions: bool = False):
+        if hasattr(data, "to_numpy") and getattr(data, "ndim", 1) == 2:
+            data = data.to_numpy()
+        self.__source = data
         self.__data = data
+        self.__fingerprint = fingerprint or (isinstance(data, np.ndarray) and data.ndim == 2)
+        self.__check_collisions = check_collisions
+        self.__values = None
+        self.__missing = 0
+        self.__rows = None
+        if not self.__fingerprint:
+            self.__load(data)
+        self.__null = None
+        self.__groups = None
+
+    # ---------- Private Methods ---------- #
+
+    def __load(self, data):
+        """
+        Set up the array backend for an ndarray or pandas Series (other data keeps the per-item path).
+        Series and object arrays get an explicit null mask (Series.isnull(), or None / NaN items):
+        missing rows are dropped and the present values narrowed to one dtype when they share a
+        scalar kind. Object columns of mixed kinds use the per-item path, with missing values as None.
+        """
+        null = None
+        if hasattr(data, "isnull") and hasattr(data, "to_numpy"):
+            null = np.asarray(data.isnull(), dtype=bool)
+            data = data.to_numpy()
+        if not isinstance(data, np.ndarray) or data.ndim != 1:
+            return
+        if data.dtype != object:
+            self.__values = data
+            return
+        if null is None:
+            null = _object_null_mask(data)
+        self.__rows = data.copy()
+        self.__rows[null] = None
+        present = _same_kind_array(data[~null].tolist())
+        if present.dtype != object:
+            self.__values, self.__missing = present, int(np.count_nonzero(null))
+        else:
+            self.__data = self.__rows.tolist()
+
+    @staticmethod
+    def __to_items(values):
+        """
+        The elements of a result array as Python objects. Datetime / timedelta values stay NumPy
+        scalars, because .tolist() turns units finer than microseconds into plain integers.
+        """
+        return list(values) if values.dtype.kind in "mM" else values.tolist()
+
+    def __null_mask(self):
+        """
+        Boolean mask of the missing values (NaN / NaT) of the array, computed once.
+        """
+        if self.__null is None:
+            self.__null = _null_mask(self.__values)
+        return self.__null
+
+    def __null_count(self):
+        """
+        Missing values: NaN / NaT in the array plus the null rows dropped when it was built.
+        """
+        return int(np.count_nonzero(self.__null_mask())) + self.__missing
+
+    def __present(self):
+        """
+        The values without the missing ones (no copy when nothing is missing).
+        """
+        mask = self.__null_mask()
+        return self.__values[~mask] if mask.any() else self.__values
+
+    def __batches(self):
+        """
+        The data in BloomFilter.BATCH-sized pieces: array slices (missing values left out) or lists.
+        """
+        if self.__values is not None:
+            present = self.__present()
+            for start in range(0, len(present), BloomFilter.BATCH):
+                yield present[start:start + BloomFilter.BATCH]
+        else:
+            iterator = iter(self.__data)
+            while batch := list(islice(iterator, BloomFilter.BATCH)):
+                yield batch
+
+    def __candidates(self, error_rate, capacity, first_only):
+        """
+        Values flagged as seen before by a Bloom filter (a superset of the real duplicates).
+        """
+        if capacity is None:
+            if not hasattr(self.__data, "__len__"):
+                raise ValueError("Capacity is needed for data without a length (e.g. a generator).")
+            capacity = max(len(self.__data), 1)
+        bloom = BloomFilter(capacity, error_rate)
+        candidates = set()
+        if self.__values is not None and self.__null_count() > 1:
+            candidates.add(None)
+            if first_only:
+                return candidates
+        for batch in self.__batches():
+            hit = bloom.add_many(batch)
+            if hit.any():
+                if isinstance(batch, np.ndarray):
+                    candidates.update(self.__to_items(batch[hit]))
+                else:
+                    candidates.update(item for item, flag in zip(batch, hit) if flag)
+                if first_only:
+                    break
+        return candidates
+
+    def __verify(self, candidates):
+        """
+        Exact second pass: keep the candidates that really occur more than once.
+        """
+        if iter(self.__data) is self.__data:
+            raise ValueError("Verification needs a second pass; a one-shot iterator cannot be read twice.")
+        if self.__values is not None:
+            confirmed = {None} if None in candidates else set()
+            values = [c for c in candidates if c is not None]
+            if values:
+                present = self.__present()
+                hits = present[np.isin(present, np.array(values, dtype=present.dtype))]
+                unique, counts = np.unique(hits, return_counts=True)
+                confirmed.update(self.__to_items(unique[counts > 1]))
+            return confirmed
+        counts = {}
+        for i in self.__data:
+            if i in candidates:
+                counts[i] = counts.get(i, 0) + 1
+        return {i for i, count in counts.items() if count > 1}
+
+    def __items(self):
+        """
+        The elements as an indexable sequence (fingerprint mode).
+        """
+        if not isinstance(self.__data, (list, tuple, np.ndarray)):
+            self.__data = list(self.__data)
+        return self.__data
+
+    def __column(self):
+        """
+        The data as a 1-D column for the null-mask operations.
+        """
+        if self.__fingerprint:
+            raise ValueError("Null-mask operations need scalar elements, not fingerprinted records.")
+        if self.__rows is not None:
+            return self.__rows
+        return self.__values if self.__values is not None else _as_column(self.__data)
 
-    def DuplicateCheck(self) -> bool:
+    def __digest_groups(self):
+        """
+        First index and count of every distinct element, grouped by fingerprint, computed once.
+        With check_collisions, groups whose elements differ are split by their canonical forms.
+        """
+        if self.__groups is None:
+            items = self.__items()
+            prints = fingerprints(items)
+            order = np.argsort(prints, kind="stable")
+            ordered = prints[order]
+            starts = np.flatnonzero(np.concatenate(([True], ordered[1:] != ordered[:-1])))
+            counts = np.diff(np.append(starts, len(ordered)))
+            first = order[starts]
+            if self.__check_collisions and len(first):
+                split_first, split_counts = [], []
+                for g in np.flatnonzero(counts > 1).tolist():
+                    forms = {}
+                    for i in order[starts[g]:starts[g] + counts[g]].tolist():
+                        forms.setdefault(canonical(items[i]), []).append(i)
+                    if len(forms) > 1:
+                        counts[g] = 0
+                        split_first.extend(members[0] for members in forms.values())
+                        split_counts.extend(len(members) for members in forms.values())
+                keep = counts > 0
+                first = np.concatenate((first[keep], np.array(split_first, dtype=first.dtype)))
+                counts = np.concatenate((counts[keep], np.array(split_counts, dtype=counts.dtype)))
+            self.__groups = (first, counts)
+        return self.__groups
+
+    def __forms(self, indices):
+        """
+        Canonical forms of the elements at the given positions.
+        """
+        items = self.__items()
+        return {canonical(items[i]) for i in indices.tolist()}
+
+    def __sorted_duplicates(self):
+        """
+        Sorted distinct values that occur more than once (adjacent equal values after a sort).
+        """
+        return _sorted_repeats(np.sort(self.__present()))
+
+    def __parallel_duplicates(self, workers):
+        """
+        Duplicates found by hash partitioning over `workers` processes, through shared memory.
+        Python collections must hold same-kind scalars (Python or NumPy bool / int, float, str or
+        datetime, None for missing values).
+        """
+        if self.__values is not None:
+            present, nulls = self.__present(), self.__null_count()
+        else:
+            items = list(self.__data)
+            nulls = len(items)
+            items = [i for i in items if i is not None]
+            nulls -= len(items)
+            present = _same_kind_array(items) if items else np.empty(0)
+            if present.dtype == object and {_scalar_kind(cls) for cls in map(type, items)} <= {"b", "iu"}:
+                # bool and int compare equal (True == 1), so they share one integer column
+                present = np.asarray(items)
+                if present.dtype == object:
+                    raise ValueError("workers > 1 needs integers that fit in 64 bits.")
+            if present.dtype == object:
+                raise ValueError("workers > 1 needs an array, a Series or a list of same-kind scalars "
+                                 "(int, float, str or datetime); use workers=1 for other collections.")
+        duplicates = {None} if nulls > 1 else set()
+        if len(present):
+            duplicates.update(self.__to_items(_shared_duplicates(present, workers)))
+        return duplicates
+
+    # ---------- Public Methods ---------- #
+
+    def DuplicateCheck(self, approximate: bool = False, error_rate: float = 0.01,
+                       capacity: int | None = None, verify: bool = False, workers: int = 1) -> bool:
+        if self.__fingerprint:
+            if approximate or workers > 1:
+                raise ValueError("Fingerprinted data supports exact, single-process detection only.")
+            return bool((self.__digest_groups()[1] > 1).any())
+        if workers > 1 and not approximate:
+            return bool(self.__parallel_duplicates(workers))
+        if approximate:
+            if verify:
+                return bool(self.__verify(self.__candidates(error_rate, capacity, False)))
+            return bool(self.__candidates(error_rate, capacity, True))
+        if self.__values is not None:
+            if self.__null_count() > 1:
+                return True
+            ordered = np.sort(self.__present())
+            return bool((ordered[1:] == ordered[:-1]).any())
         seen = set()
         for i in self.__data:
             if i in seen:
@@ -347,7 +1781,27 @@ class Data:
             seen.add(i)
         return False
 
-    def ReturnDuplicates(self) -> set | None:
+    def ReturnDuplicates(self, approximate: bool = False, error_rate: float = 0.01,
+                         capacity: int | None = None, verify: bool = False, workers: int = 1) -> set | None:
+        if self.__fingerprint:
+            if approximate or workers > 1:
+                raise ValueError("Fingerprinted data supports exact, single-process detection only.")
+            first, counts = self.__digest_groups()
+            duplicates = self.__forms(first[counts > 1])
+            return duplicates if duplicates else None
+        if workers > 1 and not approximate:
+            duplicates = self.__parallel_duplicates(workers)
+            return duplicates if duplicates else None
+        if approximate:
+            duplicates = self.__candidates(error_rate, capacity, False)
+            if verify:
+                duplicates = self.__verify(duplicates)
+            return duplicates if duplicates else None
+        if self.__values is not None:
+            duplicates = set(self.__to_items(self.__sorted_duplicates()))
+            if self.__null_count() > 1:
+                duplicates.add(None)
+            return duplicates if duplicates else None
         seen = set()
         duplicates = set()
         for i in self.__data:
@@ -358,29 +1812,428 @@ class Data:
         return duplicates if duplicates else None
      
     def UniqueData(self) -> set:
+        if self.__fingerprint:
+            return self.__forms(self.__digest_groups()[0])
+        if self.__values is not None:
+            unique = set(self.__to_items(np.unique(self.__present())))
+            if self.__null_count():
+                unique.add(None)
+            return unique
         return set(self.__data)
 
     def NullCheck(self) -> bool:
+        if self.__fingerprint and isinstance(self.__data, np.ndarray) and self.__data.ndim == 2:
+            return False
+        if self.__values is not None:
+            return self.__null_count() > 0
         return any(i is None for i in self.__data)
 
+    def Profile(self, chunksize: int = 1_000_000, precision: int = 14, capacity: int = 1024) -> DataProfile:
+        """
+        Profile the data in one chunked pass.
+        """
+        profile = DataProfile(precision, capacity)
+        if self.__values is not None:
+            for start in range(0, len(self.__values), chunksize):
+                profile.update(self.__values[start:start + chunksize])
+            if self.__missing:
+                profile.update([None] * self.__missing)
+            return profile
+        iterator = iter(self.__items()) if self.__fingerprint else iter(self.__data)
+        while chunk := list(islice(iterator, chunksize)):
+            profile.update(map(canonical, chunk) if self.__fingerprint else chunk)
+        return profile
+
+    def ToArray(self) -> np.ndarray:
+        """
+        The data as a NumPy array in its original order (None -> NaN for Python collections).
+        """
+        if self.__values is not None and not self.__missing:
+            return self.__values
+        rows = self.__rows if self.__rows is not None else self.__items()
+        return np.asarray([np.nan if i is None else i for i in rows])
+
+    def NullMask(self, sentinels=(), packed: bool = False) -> NullMask:
+        """
+        Missing-value mask of the data (None, NaN / NaT and the given sentinel values).
+        """
+        return NullMask(self.__column(), sentinels, packed)
+
+    def DropNull(self, sentinels=()) -> np.ndarray:
+        """
+        Compact array of the present values, in order and with duplicates (unlike RmNull).
+        """
+        return NullMask(self.__column(), sentinels).filter()
+
+    def Lazy(self, sentinels=()) -> LazyData:
+        """
+        Start a lazy RmNull / Dedupe / Sort chain over the data.
+        """
+        return LazyData(self.__column(), sentinels)
+
+    def __set_operation(self, operation, other, assume_sorted, out):
+        """
+        Sorted merge of the cleaned (null-free, distinct, sorted) values of both operands.
+        With assume_sorted, arrays / memmaps / .npy paths are used as they are.
+        """
+        def sorted_values(operand):
+            if isinstance(operand, Data):
+                return operand.__sorted_values(assume_sorted)
+            if assume_sorted or isinstance(operand, (str, os.PathLike)):
+                return operand
+            return Data(operand).__sorted_values(False)
+
+        return sorted_set_operation(operation, self.__sorted_values(assume_sorted), sorted_values(other), out=out)
+
+    def __sorted_values(self, assume_sorted):
+        if assume_sorted and self.__values is not None:
+            return self.__values
+        return self.Lazy().RmNull().Dedupe().Sort().Collect()
+
+    def Union(self, other, assume_sorted: bool = False, out=None) -> np.ndarray:
+        return self.__set_operation("union", other, assume_sorted, out)
+
+    def Intersection(self, other, assume_sorted: bool = False, out=None) -> np.ndarray:
+        return self.__set_operation("intersection", other, assume_sorted, out)
+
+    def Difference(self, other, assume_sorted: bool = False, out=None) -> np.ndarray:
+        return self.__set_operation("difference", other, assume_sorted, out)
+
     def IsEmpty(self) -> bool:
         return len(self.__data) == 0
     
     def RmNull(self) -> set:
+        if self.__fingerprint:
+            return self.UniqueData() - {None}
+        if self.__values is not None:
+            return set(self.__to_items(np.unique(self.__present())))
         return {i for i in self.__data if i is not None}
       
     def CleanData(self) -> list:
+        if self.__values is not None:
+            return self.__to_items(np.unique(self.__present()))
         return sorted(self.RmNull())
     
     def __str__(self):
-        return f"Data: {self.__data}"
+        return f"Data: {self.__source}"
+
+# Function: minmax_indices
+# Description: Min-max decimation for line plots
+# - splits the series into `buckets` equal runs (one per horizontal pixel) and keeps the position of
+#   the minimum and of the maximum of every run, plus the first and last points
+# - every vertical extent drawn at pixel resolution is preserved, so spikes never disappear
+def minmax_indices(y, buckets: int) -> np.ndarray:
+    """
+    Indices (sorted) of the points kept by min-max decimation into `buckets` runs.
+    """
+    n = len(y)
+    if buckets < 1 or n <= 2 * buckets:
+        return np.arange(n)
+    size = -(-n // buckets)
+    full = n // size
+    block = y[:full * size].reshape(full, size)
+    offsets = np.arange(full) * size
+    parts = [block.argmin(axis=1) + offsets, block.argmax(axis=1) + offsets, [0, n - 1]]
+    if full * size < n:
+        tail = y[full * size:]
+        parts.append([full * size + tail.argmin(), full * size + tail.argmax()])
+    return np.unique(np.concatenate(parts))
+
+
+# Function: lttb_indices
+# Description: Largest-Triangle-Three-Buckets decimation (Steinarsson, 2013)
+# - keeps the first and last points and one point per bucket in between
+# - in every bucket, the point forming the largest triangle with the previously kept point and the
+#   average of the next bucket is kept; this follows the visual shape of the series closely
+# The loop runs once per output point; each step is a vectorized pass over one bucket.
+def lttb_indices(y, n_out: int, x=None) -> np.ndarray:
+    """
+    Indices (sorted) of the `n_out` points kept by LTTB.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.arange(n, dtype=float) if x is None else np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    lengths = np.diff(edges)
+    avg_x = np.add.reduceat(x[:n - 1], edges[:-1]) / lengths
+    avg_y = np.add.reduceat(y[:n - 1], edges[:-1]) / lengths
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for j in range(n_out - 2):
+        lo, hi = edges[j], edges[j + 1]
+        cx, cy = (avg_x[j + 1], avg_y[j + 1]) if j + 1 < n_out - 2 else (x[-1], y[-1])
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(area.argmax())
+        selected[j + 1] = a
+    return selected
+
 
 ### data visualization
 # This class is designed to handle a collection of data and visualize it using matplotlib.
-# It can accept data in the form of a set, list, or tuple.  
-class DataVisualization:    
-    pass
+# It can accept data in the form of a set, list, or tuple, a NumPy array, a Data object or a Stats
+# object (whose sorted values give a quantile plot).
+# Long series are decimated to the pixel budget of the figure before plotting: min-max decimation
+# (2 points per horizontal pixel) or LTTB (1 point per pixel), so tens of millions of points render
+# as fast as a few thousand. Missing values (None / NaN) are dropped.
+# Rendering is headless: figures are drawn by the Agg canvas directly (no pyplot, no window, no
+# global state) and written to PNG or SVG depending on the file extension.
+# Distribution charts (histogram, box plot, ECDF) are drawn from summaries instead of raw data:
+# a HistogramAccumulator, a Stats object built with backend="histogram" (both filled in one
+# streaming pass), or an in-memory Stats (sorted values, read at a fixed number of ranks). Their cost
+# depends on the number of bins / points drawn, not on the number of values summarised.
+# render_many() draws a batch of charts on one figure template (same Figure, Axes and canvas),
+# replacing only the plotted artists between charts.
+# Example usage:
+# v = DataVisualization(np.cumsum(np.random.normal(size=10_000_000)), method="lttb")
+# v.line_plot("walk.png", title="Random walk")
+# print(v.get_point_count(), len(v.get_points()[0]))   # Output: 10000000 1200
+# h = HistogramAccumulator(); h.update(np.random.normal(size=10_000_000))
+# DataVisualization.histogram(h, "hist.svg", bins=80)
+# DataVisualization.render_many("ecdf", [s1, s2, s3], ["a.png", "b.png", "c.png"])
+class DataVisualization:
+    # Output formats written by the Agg / SVG canvases.
+    FORMATS = ("png", "svg")
+    METHODS = ("minmax", "lttb", "none")
+    CHARTS = ("histogram", "box", "ecdf")
+
+    def __init__(self, data, x=None, width: int = 1200, height: int = 600, dpi: int = 100,
+                 method: str = "minmax"):
+        """
+        Initialize with the series (and optional x values) and the figure size in pixels.
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Method must be one of {self.METHODS}.")
+        if width < 1 or height < 1 or dpi < 1:
+            raise ValueError("Width, height and dpi must be positive.")
+        y = self.__series(data)
+        x = np.arange(len(y), dtype=float) if x is None else np.asarray(x, dtype=float)
+        if x.shape != y.shape:
+            raise ValueError("x and the data must have the same length.")
+        present = ~(np.isnan(y) | np.isnan(x))
+        self.__X, self.__Y = (x, y) if present.all() else (x[present], y[present])
+        self.__Width, self.__Height, self.__Dpi = width, height, dpi
+        self.__Method = method
+        self.__Points = None
+
+    # ---------- Private Methods ---------- #
+
+    @staticmethod
+    def __series(data):
+        """
+        The values to plot, as a float array.
+        """
+        if isinstance(data, Stats):
+            if data.is_streamed():
+                raise ValueError("Streamed Stats keep no values; plot their histogram instead.")
+            return np.asarray(data.get_DataArray(), dtype=float)
+        if isinstance(data, Data):
+            data = data.ToArray()
+        elif isinstance(data, set):
+            data = sorted(data, key=lambda i: (i is None, i if i is not None else 0))
+        if not isinstance(data, np.ndarray) and not hasattr(data, "to_numpy"):
+            data = [np.nan if i is None else i for i in data]
+        values = np.asarray(data, dtype=float)
+        if values.ndim != 1:
+            raise ValueError("Data must be one-dimensional.")
+        return values
+
+    @staticmethod
+    def __new_figure(width, height, dpi):
+        """
+        A new Figure attached to a headless Agg canvas.
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+        FigureCanvasAgg(figure)
+        return figure
+
+    @classmethod
+    def __save(cls, figure, path):
+        """
+        Write the figure to PNG or SVG, chosen by the file extension.
+        """
+        extension = str(path).rsplit(".", 1)[-1].lower()
+        if extension not in cls.FORMATS:
+            raise ValueError(f"Output file must end with one of {cls.FORMATS}.")
+        figure.savefig(path, format=extension)
+        return path
+
+    @staticmethod
+    def __source(summary):
+        """
+        (HistogramAccumulator, None) for binned summaries, (None, Stats) for in-memory Stats.
+        """
+        if isinstance(summary, HistogramAccumulator):
+            return summary, None
+        if isinstance(summary, Stats):
+            if summary.get_histogram() is not None:
+                return summary.get_histogram(), None
+            if summary.is_streamed():
+                raise ValueError("Exact streamed Stats keep no bins; build them with backend='histogram'.")
+            if not summary.get_DataLength():
+                raise ValueError("Nothing to plot: the summary is empty.")
+            return None, summary
+        raise TypeError("Summary must be a Stats or HistogramAccumulator object.")
+
+    @staticmethod
+    def __rebin(counts, edges, bins):
+        """
+        Merge adjacent bins so that at most `bins` remain (equal-width edges).
+        """
+        group = -(-len(counts) // bins)
+        if group <= 1:
+            return counts, edges
+        pad = -len(counts) % group
+        merged = np.pad(counts, (0, pad)).reshape(-1, group).sum(axis=1)
+        return merged, edges[0] + (edges[1] - edges[0]) * group * np.arange(len(merged) + 1)
+
+    @classmethod
+    def __binned(cls, summary, bins):
+        """
+        (counts, edges) of a summary, with at most `bins` bins.
+        """
+        histogram, stats = cls.__source(summary)
+        if stats is not None:
+            return np.histogram(stats.get_DataArray(), bins=bins, weights=stats.get_weights())
+        if not len(histogram.get_counts()):
+            raise ValueError("Nothing to plot: the summary is empty.")
+        return cls.__rebin(histogram.get_counts(), histogram.get_edges(), bins)
+
+    @classmethod
+    def __ecdf_points(cls, summary, points):
+        """
+        (x, share of values <= x) at about `points` positions.
+        """
+        histogram, stats = cls.__source(summary)
+        if stats is None:
+            counts, edges = cls.__binned(histogram, points)
+            cumulative = np.concatenate(([0], np.cumsum(counts)))
+            return edges, cumulative / cumulative[-1]
+        data = stats.get_DataArray()
+        weights = stats.get_weights()
+        cumulative = np.arange(1, len(data) + 1) if weights is None else np.cumsum(weights)
+        ranks = np.unique(np.linspace(0, len(data) - 1, points).astype(np.intp))
+        return data[ranks], cumulative[ranks] / cumulative[-1]
+
+    @staticmethod
+    def __box_stats(summary, label):
+        """
+        Box-plot statistics (matplotlib bxp format) from the quartiles of a summary.
+        Whiskers end at the Tukey fences, clipped to the min / max; a min or max beyond a fence
+        is drawn as the only flier on that side.
+        """
+        stats = Stats.from_histogram(summary) if isinstance(summary, HistogramAccumulator) else summary
+        if not stats.get_DataLength():
+            raise ValueError("Nothing to plot: the summary is empty.")
+        q1, median, q3 = stats.get_percentile(25), stats.get_percentile(50), stats.get_percentile(75)
+        low, high = stats.get_minimum(), stats.get_maximum()
+        iqr = q3 - q1
+        whislo, whishi = max(low, q1 - 1.5 * iqr), min(high, q3 + 1.5 * iqr)
+        return {"label": label, "med": median, "q1": q1, "q3": q3, "whislo": whislo, "whishi": whishi,
+                "mean": stats.get_mean(), "fliers": [v for v in (low, high) if v < whislo or v > whishi]}
+
+    @classmethod
+    def __draw(cls, kind, axes, summary, bins, points):
+        """
+        Draw one chart on the axes; return the artists that were added.
+        """
+        if kind == "histogram":
+            counts, edges = cls.__binned(summary, bins)
+            return [axes.stairs(counts, edges, fill=True, alpha=0.75, color="C0")]
+        if kind == "ecdf":
+            x, y = cls.__ecdf_points(summary, points)
+            return axes.step(x, y, where="post", color="C0")
+        summaries = summary if isinstance(summary, (list, tuple)) else [summary]
+        parts = axes.bxp([cls.__box_stats(s, str(j + 1)) for j, s in enumerate(summaries)], showmeans=True)
+        return [artist for group in parts.values() for artist in group]
+
+    # ---------- Public Methods ---------- #
+
+    def get_points(self):
+        """
+        The decimated (x, y) points that are actually drawn, computed once.
+        """
+        if self.__Points is None:
+            if self.__Method == "minmax":
+                keep = minmax_indices(self.__Y, self.__Width)
+            elif self.__Method == "lttb":
+                keep = lttb_indices(self.__Y, self.__Width, self.__X)
+            else:
+                keep = np.arange(len(self.__Y))
+            self.__Points = (self.__X[keep], self.__Y[keep])
+        return self.__Points
+
+    def get_point_count(self): return len(self.__Y)
+    def get_method(self): return self.__Method
+
+    def line_plot(self, path, title: str | None = None, xlabel: str = "Index", ylabel: str = "Value"):
+        """
+        Render the (decimated) series as a line plot and write it to `path` (.png or .svg).
+        """
+        x, y = self.get_points()
+        figure = self.__new_figure(self.__Width, self.__Height, self.__Dpi)
+        axes = figure.add_subplot()
+        axes.plot(x, y, linewidth=0.8)
+        axes.set_xlabel(xlabel)
+        axes.set_ylabel(ylabel)
+        if title:
+            axes.set_title(title)
+        return self.__save(figure, path)
+
+    @classmethod
+    def render_many(cls, kind: str, summaries, paths, titles=None, xlabel: str = "Value", bins: int = 50,
+                    points: int = 512, width: int = 800, height: int = 500, dpi: int = 100) -> list:
+        """
+        Render one `kind` chart ("histogram", "box" or "ecdf") per summary to the matching path,
+        reusing a single figure template. For box plots, an item may be a list of summaries
+        (one box each).
+        """
+        if kind not in cls.CHARTS:
+            raise ValueError(f"Chart must be one of {cls.CHARTS}.")
+        if len(summaries) != len(paths):
+            raise ValueError("Give one output path per summary.")
+        figure = cls.__new_figure(width, height, dpi)
+        axes = figure.add_subplot()
+        axes.set_xlabel("" if kind == "box" else xlabel)
+        axes.set_ylabel({"histogram": "Count", "box": xlabel, "ecdf": "Cumulative share"}[kind])
+        artists = []
+        for i, (summary, path) in enumerate(zip(summaries, paths)):
+            for artist in artists:
+                artist.remove()
+            artists = cls.__draw(kind, axes, summary, bins, points)
+            axes.relim()
+            axes.autoscale_view()
+            axes.set_title(titles[i] if titles else "")
+            cls.__save(figure, path)
+        return list(paths)
+
+    @classmethod
+    def histogram(cls, summary, path, title: str | None = None, bins: int = 50, **kwargs):
+        """
+        Histogram of a HistogramAccumulator or Stats object, with at most `bins` bars.
+        """
+        return cls.render_many("histogram", [summary], [path], [title] if title else None, bins=bins, **kwargs)[0]
+
+    @classmethod
+    def box_plot(cls, summaries, path, title: str | None = None, **kwargs):
+        """
+        Box plot from the quartiles of one summary or a list of summaries (one box each).
+        """
+        return cls.render_many("box", [summaries], [path], [title] if title else None, **kwargs)[0]
+
+    @classmethod
+    def ecdf(cls, summary, path, title: str | None = None, points: int = 512, **kwargs):
+        """
+        Empirical CDF of a HistogramAccumulator or Stats object, drawn at about `points` positions.
+        """
+        return cls.render_many("ecdf", [summary], [path], [title] if title else None, points=points, **kwargs)[0]
 
 
-d = Data([3, None, 2, 1, 2, None])
-print(d.CleanData())  # 👉 [1, 2, 3]
+if __name__ == "__main__":
+    d = Data([3, None, 2, 1, 2, None])
+    print(d.CleanData())  # 👉 [1, 2, 3]
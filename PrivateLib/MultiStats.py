@@ -0,0 +1,197 @@
+## MultiStats Class
+# This class computes statistics for every column of a 2-D array (rows = samples, columns = features).
+# Instead of one Stats object per column, all per-column moments are computed in single vectorized
+# passes with the shared Moments accumulator, together with the covariance co-moment matrix.
+# Rows are consumed in fixed-size chunks that are merged pairwise, so tall matrices (np.memmap,
+# or any generator of row blocks via MultiStats.from_chunks) never need to fit in memory at once.
+# It provides:
+#    • Per-column Count, Mean, Variance, Std. Dev, Min, Max, Range, Skewness, Kurtosis
+#    • Covariance matrix (population, consistent with Stats.get_variance)
+#    • Pearson and Spearman correlation matrices
+# Example usage:
+# m = MultiStats([[1, 2], [2, 4], [3, 7]])
+# print(m.get_mean())                          # Output: [2.         4.33333333]
+# print(m.get_correlation("spearman"))         # Output: [[1. 1.] [1. 1.]]
+
+import os
+import tempfile
+
+import numpy as np
+
+from LiteData import Moments
+
+
+class MultiStats:
+    def __init__(self, data, chunksize: int = 100_000, columns=None):
+        """
+        Initialize with a 2-D array-like (NumPy array, np.memmap or pandas DataFrame).
+        Rows are accumulated `chunksize` at a time.
+        """
+        if columns is None and hasattr(data, "columns"):
+            columns = list(data.columns)
+        if not isinstance(data, np.ndarray):
+            data = np.asarray(data, dtype=float)
+        if data.ndim != 2:
+            raise ValueError("Data must be a 2-D array (rows x columns).")
+        if chunksize < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        self.__Source = data
+        self.__ChunkSize = chunksize
+        self.__Columns = columns if columns is not None else list(range(data.shape[1]))
+        self.__Moments, self.__CoMoment = self.__accumulate(
+            data[i:i + chunksize] for i in range(0, len(data), chunksize))
+
+    @classmethod
+    def from_chunks(cls, chunks, columns=None):
+        """
+        Build the statistics from an iterable/generator of 2-D row blocks.
+        Only one block is held in memory at a time. Spearman correlation needs global ranks,
+        so it is not available for objects built this way.
+        """
+        result = cls.__new__(cls)
+        result.__Source = None
+        result.__ChunkSize = None
+        result.__Moments, result.__CoMoment = cls.__accumulate(chunks)
+        width = 0 if result.__CoMoment is None else len(result.__CoMoment)
+        result.__Columns = columns if columns is not None else list(range(width))
+        return result
+
+    # ---------- Private Methods ---------- #
+
+    @staticmethod
+    def __accumulate(chunks):
+        """
+        Merge per-chunk moments and co-moments: C = Ca + Cb + outer(δ, δ)·na·nb / n.
+        """
+        moments = Moments()
+        comoment = None
+        for block in chunks:
+            block = np.asarray(block, dtype=float)
+            if block.ndim != 2:
+                raise ValueError("Every chunk must be a 2-D array (rows x columns).")
+            if len(block) == 0:
+                continue
+            part = Moments.from_array(block)
+            dev = block - part.get_mean()
+            part_co = dev.T @ dev
+            if comoment is None:
+                comoment = part_co
+            else:
+                na, nb = moments.get_count(), part.get_count()
+                delta = part.get_mean() - moments.get_mean()
+                comoment = comoment + part_co + np.outer(delta, delta) * na * nb / (na + nb)
+            moments.merge(part)
+        return moments, comoment
+
+    @staticmethod
+    def __rank(column):
+        """
+        Rank one column with average ranks for ties (1-based), fully vectorized.
+        """
+        n = len(column)
+        order = np.argsort(column, kind="mergesort")
+        ordered = column[order]
+        first = np.concatenate(([True], ordered[1:] != ordered[:-1]))
+        group = np.cumsum(first) - 1
+        bounds = np.append(np.flatnonzero(first), n)
+        average = (bounds[:-1] + bounds[1:] - 1) / 2 + 1
+        ranks = np.empty(n)
+        ranks[order] = average[group]
+        return ranks
+
+    def __spearman(self):
+        """
+        Spearman correlation = Pearson correlation of the column ranks.
+        Ranks are computed one column at a time; for an np.memmap source the rank matrix
+        is written to a temporary memory-mapped file so it never sits in RAM as a whole.
+        """
+        if self.__Source is None:
+            raise ValueError("Spearman correlation needs the full data; build MultiStats from an array.")
+        shape = self.__Source.shape
+        with tempfile.TemporaryDirectory() as tmp:
+            if isinstance(self.__Source, np.memmap):
+                ranks = np.lib.format.open_memmap(os.path.join(tmp, "ranks.npy"), mode="w+",
+                                                  dtype=float, shape=shape)
+            else:
+                ranks = np.empty(shape)
+            for j in range(shape[1]):
+                ranks[:, j] = self.__rank(np.asarray(self.__Source[:, j], dtype=float))
+            rank_stats = MultiStats(ranks, self.__ChunkSize)
+            result = rank_stats.get_correlation("pearson")
+            del ranks, rank_stats
+        return result
+
+    # ---------- Public Getters ---------- #
+
+    def get_columns(self): return self.__Columns
+    def get_count(self): return self.__Moments.get_count()
+
+    def get_mean(self): return self.__Moments.get_mean()
+    def get_variance(self): return self.__Moments.get_variance()
+    def get_std_dev(self):
+        var = self.get_variance()
+        return np.sqrt(var) if var is not None else None
+
+    def get_minimum(self): return self.__Moments.get_minimum()
+    def get_maximum(self): return self.__Moments.get_maximum()
+    def get_range(self):
+        return self.get_maximum() - self.get_minimum() if self.get_count() else None
+
+    def get_skewness(self):
+        """
+        Per-column skewness (0 when there are fewer than 3 rows, as in Stats).
+        """
+        if self.get_count() < 3:
+            return np.zeros(len(self.__Columns))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.__Moments.get_skewness()
+
+    def get_kurtosis(self):
+        """
+        Per-column excess kurtosis (0 when there are fewer than 4 rows, as in Stats).
+        """
+        if self.get_count() < 4:
+            return np.zeros(len(self.__Columns))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.__Moments.get_kurtosis()
+
+    def get_covariance(self):
+        """
+        Population covariance matrix (diagonal equals get_variance()).
+        """
+        if not self.get_count():
+            return None
+        return self.__CoMoment / self.get_count()
+
+    def get_correlation(self, method: str = "pearson"):
+        """
+        Correlation matrix, method = "pearson" or "spearman".
+        Constant columns give NaN correlations.
+        """
+        if method == "spearman":
+            return self.__spearman()
+        if method != "pearson":
+            raise ValueError("Method must be 'pearson' or 'spearman'.")
+        cov = self.get_covariance()
+        if cov is None:
+            return None
+        sd = np.sqrt(np.diag(cov))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = cov / np.outer(sd, sd)
+        return np.clip(corr, -1.0, 1.0)
+
+    def summary(self):
+        """
+        Print a clean and formatted per-column summary.
+        """
+        mean, sd = self.get_mean(), self.get_std_dev()
+        low, high = self.get_minimum(), self.get_maximum()
+        skew, kurt = self.get_skewness(), self.get_kurtosis()
+        print("\n📊 Multi-Column Statistics Summary:")
+        print(f"Rows: {self.get_count()}")
+        print("-" * 72)
+        print(f"{'Column':<12}{'Mean':>10}{'Std. Dev':>10}{'Min':>10}{'Max':>10}{'Skew':>10}{'Kurt':>10}")
+        for j, name in enumerate(self.__Columns):
+            print(f"{str(name):<12}{mean[j]:>10.2f}{sd[j]:>10.2f}{low[j]:>10.2f}"
+                  f"{high[j]:>10.2f}{skew[j]:>10.4f}{kurt[j]:>10.4f}")
+        print("-" * 72)
@@ -0,0 +1,153 @@
+## NullMask Class
+# Missing-value mask of a column, kept next to the values instead of building a cleaned set.
+# Missing means None, NaN / NaT, or one of the given sentinel values (e.g. -999 or "").
+# The mask is a boolean array, or bit-packed with packed=True (np.packbits: 1 bit per value,
+# 8x smaller). Counting and filtering work on the mask: count() and any() never copy the values,
+# masked() is a masked-array view of the values and filter() one compact array of the present
+# values, in their original order and with their duplicates.
+# Example usage:
+# m = NullMask([3, None, 2, -999, 2], sentinels=(-999,), packed=True)
+# print(m.count(), m.filter())   # Output: 2 [3 2 2]
+
+import numpy as np
+
+
+# ---------- Private Helpers ---------- #
+
+def _null_mask(values):
+    """
+    Boolean mask of the missing values (NaN / NaT) of a 1-D array.
+    """
+    kind = values.dtype.kind
+    if kind in "fc":
+        return np.isnan(values)
+    if kind in "mM":
+        return np.isnat(values)
+    return np.zeros(len(values), dtype=bool)
+
+
+def _is_missing(item):
+    """
+    True for None and values unequal to themselves (NaN, NaT); pandas' NA, which cannot be
+    compared, counts as missing too.
+    """
+    if item is None:
+        return True
+    try:
+        return bool(item != item)
+    except TypeError:
+        return True
+
+
+def _object_null_mask(values):
+    """
+    Boolean mask of the missing values of a 1-D object array.
+    """
+    return np.fromiter(map(_is_missing, values), dtype=bool, count=len(values))
+
+
+# Python types of the scalar kinds a column may be narrowed to, with the dtype kinds they give.
+_SCALAR_KINDS = (((bool, np.bool_), "b"), ((int, np.integer), "iu"), ((float, np.floating), "f"),
+                 ((str,), "U"), ((np.datetime64,), "M"), ((np.timedelta64,), "m"))
+
+
+def _scalar_kind(cls):
+    """
+    Dtype kinds a Python type converts to, or None for non-scalar / other types.
+    """
+    for types, kind in _SCALAR_KINDS:
+        if issubclass(cls, types):
+            return kind
+    return None
+
+
+def _same_kind_array(items):
+    """
+    A typed array of the items when they all share one scalar kind (bool, int, float, str or
+    datetime), else an object array. Mixed kinds are never converted, so 1 and '1' stay apart.
+    """
+    kinds = {_scalar_kind(cls) for cls in set(map(type, items))}
+    if len(kinds) == 1 and None not in kinds:
+        column = np.asarray(items)
+        if column.ndim == 1 and column.dtype.kind in kinds.pop():
+            return column
+    column = np.empty(len(items), dtype=object)
+    column[:] = items
+    return column
+
+
+def _as_column(values):
+    """
+    A 1-D NumPy array of a column (Series / Python collections converted, mixed ones as objects).
+    """
+    if hasattr(values, "isnull") and hasattr(values, "to_numpy"):
+        values = values.to_numpy()
+    if isinstance(values, np.ndarray):
+        if values.ndim != 1:
+            raise ValueError("A column must be one-dimensional.")
+        return values
+    items = list(values)
+    return _same_kind_array(items) if items else np.empty(0)
+
+
+class NullMask:
+    # Number of set bits of every byte value (popcount of a packed mask).
+    POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def __init__(self, values, sentinels=(), packed: bool = False):
+        """
+        Build the mask of `values` (array, Series or Python collection).
+        """
+        self.__Values = _as_column(values)
+        mask = _null_mask(self.__Values) if self.__Values.dtype.kind != "O" else _object_null_mask(self.__Values)
+        if len(sentinels):
+            mask |= np.isin(self.__Values, np.asarray(sentinels, dtype=self.__Values.dtype
+                                                      if self.__Values.dtype.kind != "O" else object))
+        self.__Length = len(mask)
+        self.__Packed = packed
+        self.__Mask = np.packbits(mask) if packed else mask
+
+    # ---------- Public Methods ---------- #
+
+    def count(self) -> int:
+        """
+        Number of missing values.
+        """
+        if self.__Packed:
+            return int(self.POPCOUNT[self.__Mask].sum(dtype=np.int64))
+        return int(np.count_nonzero(self.__Mask))
+
+    def any(self) -> bool:
+        return bool(self.__Mask.any())
+
+    def filter(self) -> np.ndarray:
+        """
+        Compact array of the present values (original order, duplicates kept; the values
+        themselves when nothing is missing). Object columns get the dtype of their present values
+        when those all share one scalar kind, and stay object arrays otherwise.
+        """
+        present = self.__Values if not self.any() else self.__Values[~self.get_mask()]
+        if present.dtype.kind == "O" and len(present):
+            return _same_kind_array(present.tolist())
+        return present
+
+    def masked(self):
+        """
+        Masked-array view of the values with the missing ones hidden (no copy of the values).
+        """
+        return np.ma.MaskedArray(self.__Values, mask=self.get_mask(), copy=False)
+
+    # ---------- Public Getters ---------- #
+
+    def get_values(self): return self.__Values
+    def get_packed(self): return self.__Mask if self.__Packed else np.packbits(self.__Mask)
+    def get_nbytes(self): return self.__Mask.nbytes
+    def is_packed(self): return self.__Packed
+
+    def get_mask(self):
+        """
+        The mask as a boolean array (unpacked on demand).
+        """
+        if self.__Packed:
+            return np.unpackbits(self.__Mask, count=self.__Length).view(bool)
+        return self.__Mask
@@ -0,0 +1,156 @@
+## Outliers Class
+# This class flags outliers of a numeric dataset as NumPy boolean masks (True = outlier).
+# It reuses the statistics already computed by a Stats instance of the same data
+# (quartiles, mean, std. dev, median) instead of recomputing them, and works on the data
+# in its original order so masks line up with the input.
+# Detectors:
+#    • IQR fences      : x < Q1 - k·IQR or x > Q3 + k·IQR
+#    • Z-score         : |x - mean| / σ > threshold
+#    • Modified z-score: 0.6745·|x - median| / MAD > threshold
+#    • Hampel filter   : same test against a centred rolling median / MAD
+#    • Rolling z-score : z-score against the preceding window (RollingStats.batch)
+# A mask can be turned into indices, a masked-array view that shares the data buffer (no copy),
+# or a compact array of the inliers.
+# Example usage:
+# o = Outliers([10, 12, 11, 13, 12, 95, 11])
+# mask = o.iqr_mask()
+# print(o.get_indices(mask))   # Output: [5]
+# print(o.get_masked(mask))    # Output: [10.0 12.0 11.0 13.0 12.0 -- 11.0]
+
+import numpy as np
+
+from LiteData import Stats
+from RollingStats import RollingStats
+
+# Scale factor that makes the MAD a consistent estimator of σ for normal data (Φ⁻¹(0.75)).
+MAD_SCALE = 0.6745
+
+# Maximum number of window elements materialised at once by the Hampel filter.
+HAMPEL_BLOCK_ELEMENTS = 4_000_000
+
+
+class Outliers:
+    def __init__(self, data, stats: Stats | None = None):
+        """
+        Initialize with the data (in its original order) and, optionally, a Stats object of the
+        same data whose results are reused.
+        """
+        self.__Data = np.asarray(data, dtype=float)
+        if self.__Data.ndim != 1:
+            raise ValueError("Data must be a 1-D array.")
+        if stats is None:
+            stats = Stats(self.__Data)
+        elif stats.get_DataLength() != len(self.__Data):
+            raise ValueError("Stats object must describe the same data.")
+        self.__Stats = stats
+        self.__MAD = None
+
+    # ---------- Private Methods ---------- #
+
+    def __mad(self):
+        """
+        Median absolute deviation around the Stats median, computed once and kept.
+        """
+        if self.__MAD is None:
+            self.__MAD = float(np.median(np.abs(self.__Data - self.__Stats.get_median())))
+        return self.__MAD
+
+    @staticmethod
+    def __exceeds(deviation, scale, threshold):
+        """
+        |deviation| / scale > threshold, with a zero scale flagging every non-zero deviation.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            score = np.abs(deviation) / scale
+        return np.where(scale > 0, score > threshold, deviation != 0)
+
+    # ---------- Detectors ---------- #
+
+    def iqr_mask(self, k: float = 1.5):
+        """
+        Flag values outside the Tukey fences [Q1 - k·IQR, Q3 + k·IQR].
+        """
+        if self.__Stats.get_DataLength() < 4:
+            return np.zeros(len(self.__Data), dtype=bool)
+        q1 = self.__Stats.get_percentile(25)
+        q3 = self.__Stats.get_percentile(75)
+        iqr = q3 - q1
+        return (self.__Data < q1 - k * iqr) | (self.__Data > q3 + k * iqr)
+
+    def zscore_mask(self, threshold: float = 3.0):
+        """
+        Flag values more than `threshold` standard deviations away from the mean.
+        """
+        if not len(self.__Data):
+            return np.zeros(0, dtype=bool)
+        return self.__exceeds(self.__Data - self.__Stats.get_mean(), self.__Stats.get_std_dev(), threshold)
+
+    def mad_mask(self, threshold: float = 3.5):
+        """
+        Flag values whose modified z-score 0.6745·|x - median| / MAD exceeds `threshold`.
+        """
+        if not len(self.__Data):
+            return np.zeros(0, dtype=bool)
+        deviation = MAD_SCALE * (self.__Data - self.__Stats.get_median())
+        return self.__exceeds(deviation, self.__mad(), threshold)
+
+    def hampel_mask(self, half_window: int = 3, n_sigmas: float = 3.0):
+        """
+        Hampel filter: flag x[i] when |x[i] - m[i]| > n_sigmas · 1.4826 · MAD[i], where m and MAD
+        are the median and MAD of the centred window x[i - half_window : i + half_window + 1].
+        The first and last `half_window` values have no full window and are never flagged.
+        Windows are processed in blocks so memory stays bounded.
+        """
+        if half_window < 1:
+            raise ValueError("Half window must be at least 1.")
+        width = 2 * half_window + 1
+        mask = np.zeros(len(self.__Data), dtype=bool)
+        if len(self.__Data) < width:
+            return mask
+        windows = np.lib.stride_tricks.sliding_window_view(self.__Data, width)
+        step = max(1, HAMPEL_BLOCK_ELEMENTS // width)
+        for start in range(0, len(windows), step):
+            block = windows[start:start + step]
+            median = np.median(block, axis=1)
+            mad = np.median(np.abs(block - median[:, None]), axis=1) / MAD_SCALE
+            centre = block[:, half_window]
+            mask[start + half_window:start + half_window + len(block)] = self.__exceeds(
+                centre - median, mad, n_sigmas)
+        return mask
+
+    def rolling_zscore_mask(self, window: int, threshold: float = 3.0):
+        """
+        Flag x[i] when it is more than `threshold` σ away from the mean of the preceding window
+        x[i - window : i]. The point itself is not part of its window (inside its own window of n values
+        a z-score can never exceed (n - 1) / √n). The first `window` values are never flagged.
+        """
+        mask = np.zeros(len(self.__Data), dtype=bool)
+        rolling = RollingStats.batch(self.__Data, window)
+        if len(rolling["mean"]) < 2:
+            return mask
+        following = self.__Data[window:]
+        mask[window:] = self.__exceeds(following - rolling["mean"][:-1], rolling["std_dev"][:-1], threshold)
+        return mask
+
+    # ---------- Public Getters ---------- #
+
+    def get_stats(self): return self.__Stats
+    def get_mad(self): return self.__mad() if len(self.__Data) else None
+
+    def get_indices(self, mask):
+        """
+        Return the positions of the flagged values.
+        """
+        return np.flatnonzero(mask)
+
+    def get_masked(self, mask):
+        """
+        Return a masked-array view of the data with the flagged values hidden (no copy of the data).
+        """
+        return np.ma.MaskedArray(self.__Data, mask=mask, copy=False)
+
+    def get_inliers(self, mask):
+        """
+        Return a compact array of the values that are not flagged.
+        """
+        return self.__Data[~np.asarray(mask, dtype=bool)]
@@ -0,0 +1,183 @@
+## RollingStats Class
+# This class keeps moving statistics over a sliding window of a time series.
+# Recomputing Stats(window) at every step costs O(n·w); this class updates in O(1) amortized time:
+#    • Mean & Variance are kept as incremental moments (Welford add / remove)
+#    • Min & Max are kept with monotonic deques
+# Metrics follow the same definitions as Stats (population variance), and get_stats()
+# returns a full Stats object for the current window when the other metrics are needed.
+# RollingStats.batch(data, window) is the vectorized mode: it returns full rolling-result
+# arrays for a NumPy input without any per-element Python work.
+# Example usage:
+# r = RollingStats(3)
+# for x in [1, 5, 2, 8, 3]:
+#     r.push(x)
+# print(r.get_mean(), r.get_minimum(), r.get_maximum())  # Output: 4.333333333333333 2 8
+# print(RollingStats.batch([1, 5, 2, 8, 3], 3)["max"])   # Output: [5. 8. 8.]
+
+import math
+from collections import deque
+
+import numpy as np
+
+from LiteData import Stats
+
+
+class RollingStats:
+    def __init__(self, window: int):
+        """
+        Initialize an empty sliding window of the given size.
+        """
+        if window < 1:
+            raise ValueError("Window size must be at least 1.")
+        self.__Window = window
+        self.__Data = deque()
+        self.__Index = 0          # position of the next pushed value in the stream
+        self.__Mean = 0.0
+        self.__M2 = 0.0           # sum of squared deviations from the running mean
+        self.__MinQueue = deque()  # (index, value), values increasing
+        self.__MaxQueue = deque()  # (index, value), values decreasing
+
+    # ---------- Private Methods ---------- #
+
+    def __add(self, x):
+        """
+        Add a value to the running moments (Welford update).
+        """
+        n = len(self.__Data)
+        delta = x - self.__Mean
+        self.__Mean += delta / n
+        self.__M2 += delta * (x - self.__Mean)
+
+    def __remove(self, x):
+        """
+        Remove a value from the running moments (inverse Welford update).
+        """
+        n = len(self.__Data)
+        if n == 0:
+            self.__Mean, self.__M2 = 0.0, 0.0
+            return
+        delta = x - self.__Mean
+        self.__Mean -= delta / n
+        self.__M2 -= delta * (x - self.__Mean)
+
+    # ---------- Public Methods ---------- #
+
+    def push(self, x):
+        """
+        Slide the window one step forward with the new value `x`.
+        The oldest value is evicted once the window is full.
+        """
+        self.__Data.append(x)
+        self.__add(x)
+
+        while self.__MinQueue and self.__MinQueue[-1][1] >= x:
+            self.__MinQueue.pop()
+        self.__MinQueue.append((self.__Index, x))
+        while self.__MaxQueue and self.__MaxQueue[-1][1] <= x:
+            self.__MaxQueue.pop()
+        self.__MaxQueue.append((self.__Index, x))
+
+        if len(self.__Data) > self.__Window:
+            self.__remove(self.__Data.popleft())
+        oldest = self.__Index - len(self.__Data) + 1
+        if self.__MinQueue[0][0] < oldest:
+            self.__MinQueue.popleft()
+        if self.__MaxQueue[0][0] < oldest:
+            self.__MaxQueue.popleft()
+        self.__Index += 1
+
+    def extend(self, values):
+        """
+        Push every value of an iterable, in order.
+        """
+        for x in values:
+            self.push(x)
+
+    # ---------- Public Getters ---------- #
+
+    def get_window(self): return self.__Window
+    def get_DataLength(self): return len(self.__Data)
+    def is_full(self): return len(self.__Data) == self.__Window
+
+    def get_mean(self): return self.__Mean if self.__Data else None
+    def get_variance(self): return max(self.__M2, 0.0) / len(self.__Data) if self.__Data else None
+    def get_std_dev(self): return math.sqrt(self.get_variance()) if self.__Data else None
+
+    def get_minimum(self): return self.__MinQueue[0][1] if self.__Data else None
+    def get_maximum(self): return self.__MaxQueue[0][1] if self.__Data else None
+    def get_range(self): return self.get_maximum() - self.get_minimum() if self.__Data else None
+
+    def get_stats(self):
+        """
+        Return a full Stats object for the current window (median, IQR, skewness, ...).
+        """
+        return Stats(list(self.__Data))
+
+    # ---------- Vectorized Batch Mode ---------- #
+
+    @staticmethod
+    def __sliding_extreme(data, window, ufunc, pad):
+        """
+        Sliding min/max in O(n) with the van Herk / Gil-Werman block algorithm:
+        prefix and suffix running extremes inside blocks of size `window`,
+        combined with one element-wise ufunc call.
+        """
+        n = len(data)
+        blocks = -(-n // window)
+        padded = np.full(blocks * window, pad, dtype=float)
+        padded[:n] = data
+        padded = padded.reshape(blocks, window)
+        prefix = ufunc.accumulate(padded, axis=1).ravel()
+        suffix = ufunc.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+        return ufunc(suffix[:n - window + 1], prefix[window - 1:n])
+
+    @staticmethod
+    def __sliding_moments(data, window):
+        """
+        Sliding mean and population variance in O(n), with the same block split as __sliding_extreme:
+        the window starting at offset j of block k is the suffix of block k from j plus the prefix of
+        block k + 1 before j, so every partial sum only holds values of that window (no long
+        cumulative sums to cancel). Values are centered on the median of block k, which keeps the
+        sums small for offset data and ignores spikes outside the window.
+        """
+        count = len(data) - window + 1
+        blocks = -(-count // window)
+        padded = np.zeros((blocks + 1) * window)
+        padded[:len(data)] = data
+        pairs = np.lib.stride_tricks.sliding_window_view(padded, 2 * window)[::window]
+        center = np.median(pairs[:, :window], axis=1)
+        dev = pairs - center[:, None]
+        sums = []
+        for values in (dev, dev * dev):
+            suffix = np.cumsum(values[:, window - 1::-1], axis=1)[:, ::-1]
+            prefix = np.zeros_like(suffix)
+            np.cumsum(values[:, window:-1], axis=1, out=prefix[:, 1:])
+            sums.append((suffix + prefix).ravel()[:count])
+        shift = sums[0] / window
+        variance = np.maximum(sums[1] / window - shift * shift, 0.0)
+        return np.repeat(center, window)[:count] + shift, variance
+
+    @staticmethod
+    def batch(data, window: int) -> dict:
+        """
+        Compute the rolling mean, variance, std dev, min and max of a NumPy input.
+        Returns {metric: array}; element i describes the window data[i:i + window].
+        """
+        if window < 1:
+            raise ValueError("Window size must be at least 1.")
+        data = np.asarray(data, dtype=float)
+        if data.ndim != 1:
+            raise ValueError("Data must be a 1-D array.")
+        if len(data) < window:
+            empty = np.empty(0)
+            return {"mean": empty, "variance": empty, "std_dev": empty, "min": empty, "max": empty}
+
+        mean, variance = RollingStats.__sliding_moments(data, window)
+
+        return {
+            "mean": mean,
+            "variance": variance,
+            "std_dev": np.sqrt(variance),
+            "min": RollingStats.__sliding_extreme(data, window, np.minimum, np.inf),
+            "max": RollingStats.__sliding_extreme(data, window, np.maximum, -np.inf),
+        }
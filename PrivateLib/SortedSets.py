@@ -0,0 +1,141 @@
+## Sorted Set Operations
+# Union, intersection and difference of sorted arrays of distinct values, without hashing
+# (Data.Union / Intersection / Difference). Inputs and outputs can be memory-mapped .npy files.
+# Example usage:
+# print(sorted_set_operation("intersection", np.array([1, 2, 3]), np.array([2, 3, 4])))  # Output: [2 3]
+
+import math
+import os
+
+import numpy as np
+
+
+# Function: sorted set operations (union / intersection / difference)
+# Description: Set operations on sorted arrays of distinct values, without hashing
+# - both inputs are read in blocks: each step takes the next `block` values of both sides, cuts them at
+#   the smaller of the two block maxima and merges the aligned parts (stable sort of the two sorted
+#   runs + adjacent comparison, or searchsorted for the difference), so at least one block is
+#   finished per step and memory stays at about 2 x block values
+# - when one side is much smaller (n_small · log2(n_large) < n_large), intersection and difference
+#   use galloping instead: vectorized binary searches of the small blocks into the large array, which
+#   only touches the probed entries (cheap on np.memmap)
+# - inputs may be arrays, np.memmap or .npy paths (opened memory-mapped); with `out` the result is
+#   written to a .npy file and returned memory-mapped instead of being held in memory
+SET_OPERATIONS = ("union", "intersection", "difference")
+
+
+def _sorted_input(values):
+    """
+    A sorted 1-D array from an array-like or a .npy path (memory-mapped).
+    """
+    if isinstance(values, (str, os.PathLike)):
+        values = np.load(values, mmap_mode="r")
+    values = values if isinstance(values, np.ndarray) else np.asarray(values)
+    if values.ndim != 1:
+        raise ValueError("Sorted set operations need 1-D arrays.")
+    return values
+
+
+def _aligned_blocks(a, b, block):
+    """
+    Yield (a part, b part) pairs that cover the same value range, in order.
+    """
+    i = j = 0
+    while i < len(a) and j < len(b):
+        a_block, b_block = np.asarray(a[i:i + block]), np.asarray(b[j:j + block])
+        cutoff = min(a_block[-1], b_block[-1])
+        take_a = int(np.searchsorted(a_block, cutoff, side="right"))
+        take_b = int(np.searchsorted(b_block, cutoff, side="right"))
+        yield a_block[:take_a], b_block[:take_b]
+        i += take_a
+        j += take_b
+    for start in range(i, len(a), block):
+        yield np.asarray(a[start:start + block]), b[:0]
+    for start in range(j, len(b), block):
+        yield a[:0], np.asarray(b[start:start + block])
+
+
+def _merge_union(x, y):
+    """
+    Union of two sorted runs of distinct values: a stable sort merges the two runs, then adjacent
+    equal values are dropped.
+    """
+    merged = np.concatenate((x, y))
+    merged.sort(kind="stable")
+    return merged[np.concatenate(([True], merged[1:] != merged[:-1]))] if len(merged) else merged
+
+
+def _merge_intersection(x, y):
+    merged = np.concatenate((x, y))
+    merged.sort(kind="stable")
+    return merged[1:][merged[1:] == merged[:-1]]
+
+
+def _merge_difference(x, y):
+    if not len(y):
+        return x
+    positions = np.minimum(np.searchsorted(y, x), len(y) - 1)
+    return x[y[positions] != x]
+
+
+def _galloping_blocks(small, large, block, keep_found):
+    """
+    Yield the values of `small` found (or not found) in `large`, by binary search.
+    """
+    for start in range(0, len(small), block):
+        part = np.asarray(small[start:start + block])
+        positions = np.searchsorted(large, part)
+        found = np.zeros(len(part), dtype=bool)
+        inside = positions < len(large)
+        found[inside] = np.asarray(large[positions[inside]]) == part[inside]
+        yield part[found] if keep_found else part[~found]
+
+
+def sorted_set_blocks(operation: str, a, b, block: int = 1 << 20):
+    """
+    Stream the result of a sorted set operation as sorted arrays.
+    """
+    if operation not in SET_OPERATIONS:
+        raise ValueError(f"Operation must be one of {SET_OPERATIONS}.")
+    a, b = _sorted_input(a), _sorted_input(b)
+    if operation == "intersection" and len(a) > len(b):
+        a, b = b, a
+    if operation != "union" and len(a) * max(1, math.log2(len(b) + 1)) < len(b):
+        yield from _galloping_blocks(a, b, block, operation == "intersection")
+        return
+    combine = {"union": _merge_union, "intersection": _merge_intersection,
+               "difference": _merge_difference}[operation]
+    for a_part, b_part in _aligned_blocks(a, b, block):
+        result = combine(a_part, b_part)
+        if len(result):
+            yield result
+
+
+def sorted_set_operation(operation: str, a, b, block: int = 1 << 20, out=None) -> np.ndarray:
+    """
+    Union, intersection or difference (a - b) of two sorted arrays of distinct values.
+    With `out` (a .npy path), the result is written there and returned memory-mapped.
+    """
+    a, b = _sorted_input(a), _sorted_input(b)
+    dtype = np.result_type(a.dtype, b.dtype)
+    blocks = sorted_set_blocks(operation, a, b, block)
+    if out is None:
+        parts = list(blocks)
+        return np.concatenate(parts).astype(dtype, copy=False) if parts else np.empty(0, dtype=dtype)
+    raw = str(out) + ".part"
+    count = 0
+    try:
+        with open(raw, "wb") as handle:
+            for part in blocks:
+                part.astype(dtype, copy=False).tofile(handle)
+                count += len(part)
+        result = np.lib.format.open_memmap(out, mode="w+", dtype=dtype, shape=(count,))
+        if count:
+            source = np.memmap(raw, dtype=dtype, mode="r", shape=(count,))
+            for start in range(0, count, block):
+                result[start:start + block] = source[start:start + block]
+            del source
+        result.flush()
+    finally:
+        os.remove(raw)
+    return result